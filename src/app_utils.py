@@ -0,0 +1,166 @@
+import functools
+import os
+import queue
+import time
+from pathlib import Path
+import logging
+import base64
+import mmap
+from datetime import datetime
+from tkinter import ttk
+
+class ProgressTracker:
+    """Handles progress updates in the GUI"""
+    def __init__(self, progress_bar, progress_label):
+        self.progress_bar = progress_bar
+        self.progress_label = progress_label
+        # Workers enqueue messages here; only the Tk thread may touch
+        # the widgets, so it drains this queue on a timer
+        self.queue = queue.Queue()
+
+    def update(self, message):
+        """Queue a progress message; safe to call from any thread"""
+        self.queue.put_nowait(message)
+
+    def drain(self):
+        """Apply the latest queued message; call from the Tk thread"""
+        message = None
+        try:
+            while True:
+                message = self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        if message is not None and self.progress_label:
+            self.progress_label.config(text=message)
+
+    def start(self):
+        """Start progress bar animation"""
+        if self.progress_bar:
+            self.progress_bar.start()
+
+    def stop(self):
+        """Stop progress bar animation"""
+        if self.progress_bar:
+            self.progress_bar.stop()
+
+class FileHandler:
+    """Handles file operations and path management"""
+    # One timestamp per app session, so repeated runs reuse the string;
+    # the directory set skips redundant mkdir/stat calls on paths this
+    # process already created
+    _session_timestamp = None
+    _created_dirs = set()
+
+    @classmethod
+    def session_timestamp(cls):
+        """Timestamp string shared by every output dir this session"""
+        if cls._session_timestamp is None:
+            cls._session_timestamp = time.strftime("%Y%m%d_%H%M%S")
+        return cls._session_timestamp
+
+    @staticmethod
+    def setup_output_directory(base_name, parent_dir=None):
+        """Create and return output directory with timestamp"""
+        timestamp = FileHandler.session_timestamp()
+        if parent_dir:
+            output_dir = Path(parent_dir) / f"{base_name}_{timestamp}"
+        else:
+            output_dir = Path(f"{base_name}_{timestamp}")
+        path_str = str(output_dir)
+        if path_str not in FileHandler._created_dirs:
+            os.makedirs(path_str, exist_ok=True)
+            FileHandler._created_dirs.add(path_str)
+        return output_dir
+
+    @staticmethod
+    def get_base_name(file_path):
+        """Extract base name from file path without extension"""
+        return Path(file_path).stem
+
+    @staticmethod
+    def ensure_directory(directory):
+        """Ensure directory exists, create if it doesn't"""
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+# Cached at module level: timestamps repeat heavily across scenes and
+# cardinality is bounded by the video duration in whole seconds
+@functools.lru_cache(maxsize=65536)
+def _format_timestamp(total_seconds):
+    return f"{total_seconds // 60:02d}:{total_seconds % 60:02d}"
+
+class TimeFormatter:
+    """Handles time format conversions"""
+    @staticmethod
+    def seconds_to_timestamp(seconds):
+        """Convert seconds to MM:SS format"""
+        return _format_timestamp(int(seconds))
+
+    @staticmethod
+    def frame_to_timecode(frame_number, fps=30):
+        """Convert frame number to timecode"""
+        seconds = frame_number / fps
+        return TimeFormatter.seconds_to_timestamp(seconds)
+
+class ImageHandler:
+    """Handles image processing operations"""
+    @staticmethod
+    def image_to_base64(image_path):
+        """Convert image file to base64 string"""
+        try:
+            # Memory-map the file instead of read(): b64encode consumes
+            # the mapped pages directly, so the raw bytes are never
+            # copied into a second Python object and peak memory per
+            # frame drops by the file's size
+            with open(image_path, "rb") as img_file:
+                mm = mmap.mmap(img_file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    return base64.b64encode(mm).decode('ascii')
+                finally:
+                    mm.close()
+        except Exception as e:
+            logging.error(f"Error converting image to base64: {str(e)}")
+            raise
+
+class Logger:
+    """Handles application logging"""
+    @staticmethod
+    def setup(output_dir, name='video_narrator'):
+        """Setup logging configuration"""
+        log_file = Path(output_dir) / f"{name}.log"
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler(log_file),
+                logging.StreamHandler()
+            ]
+        )
+        return logging.getLogger(name)
+
+# Named styles are registered once per process; widgets then reference
+# them by name, so Tk resolves padding from its cached style instead of
+# re-parsing per-widget option values at every creation burst
+_STYLES_CONFIGURED = False
+
+def configure_styles():
+    """Register the shared ttk styles; call once after Tk() exists"""
+    global _STYLES_CONFIGURED
+    if _STYLES_CONFIGURED:
+        return
+    style = ttk.Style()
+    style.configure('Padded.TFrame', padding=10)
+    style.configure('App.TButton', padding=(6, 3))
+    style.configure('App.TLabel', padding=(2, 2))
+    _STYLES_CONFIGURED = True
+
+def create_styled_frame(parent, **kwargs):
+    """Create a ttk Frame using the shared padded style"""
+    return ttk.Frame(parent, style='Padded.TFrame', **kwargs)
+
+def create_styled_button(parent, text, command, **kwargs):
+    """Create a ttk Button using the shared style"""
+    return ttk.Button(parent, text=text, command=command, style='App.TButton', **kwargs)
+
+def create_styled_label(parent, text, **kwargs):
+    """Create a ttk Label using the shared style"""
+    return ttk.Label(parent, text=text, style='App.TLabel', **kwargs)
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+Shared OpenAI client construction for Video Narrator Pro.
+Builds HTTP/2-pooled async clients for analysis and narration runs.
+"""
+
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+def get_async_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """Build an AsyncOpenAI client backed by an HTTP/2 connection pool.
+
+    The pool multiplexes every concurrent call within a run over a few
+    keep-alive connections, amortizing TCP/TLS handshakes. A fresh
+    client is built per run on purpose: each run drives its own
+    asyncio.run() loop, and keep-alive connections created on one loop
+    break with "Event loop is closed" when reused from the next, so the
+    caller must close the client before its loop exits.
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32
+            )
+        )
+    )
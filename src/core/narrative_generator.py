@@ -5,20 +5,53 @@ Outputs both clean narration text and technical timing information.
 """
 
 import json
+import random
+import re
+import asyncio
+import hashlib
 from pathlib import Path
 import logging
-import time
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable
 
-from openai import OpenAI
+import orjson
+from openai import OpenAI, RateLimitError, APIConnectionError
 
 from ..utils.progress_tracking import ProgressTracker
 from ..utils.file_handling import FileHandler
+from .client import get_async_client
 from .templates import Template
 
+# Keep combined batch prompts comfortably inside the model context window
+MAX_BATCH_PROMPT_TOKENS = 6000
+
+# The model rejects requests asking for more completion tokens than
+# this, so batches are also capped so 500 tokens per scene always fits
+MAX_COMPLETION_TOKENS = 4096
+MAX_SCENES_PER_BATCH = MAX_COMPLETION_TOKENS // 500
+
+# Completions are cached here keyed on (messages, parameters), so reruns
+# over unchanged analysis data skip the network entirely
+CACHE_DIR = Path.home() / '.cache' / 'video-narrator'
+
+# Narrations below this size read fine without the extra polish pass,
+# so skip its serial round-trip entirely
+MIN_POLISH_TOKENS = 1500
+
 class NarrativeGenerator:
     """Generates natural narration from video analysis"""
+
+    # Transition phrases that mark a scene boundary, built once at class
+    # creation; the single compiled scan replaces eight Python-level
+    # substring probes (and the per-frame lower() allocation)
+    _TRANSITION_TERMS = (
+        'moving to', 'entering', 'stepping into', 'next we have',
+        'moving into', 'heading to', 'walking into', 'now in'
+    )
+    _TRANSITION_RE = re.compile(
+        r'\b(?:' + '|'.join(re.escape(term) for term in _TRANSITION_TERMS) + r')\b',
+        re.IGNORECASE
+    )
     
     def __init__(
         self, 
@@ -26,17 +59,18 @@ class NarrativeGenerator:
         template: Template,
         openai_client: OpenAI,
         progress_tracker: Optional[ProgressTracker] = None,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        enable_cache: bool = True
     ):
         """Initialize narrative generator"""
         self.json_path = Path(json_path)
         self.template = template
         self.client = openai_client
         self.progress = progress_tracker
+        self.enable_cache = enable_cache
         
         # Load analysis data
-        with open(json_path, 'r', encoding='utf-8') as f:
-            self.analysis_data = json.load(f)
+        self.analysis_data = orjson.loads(self.json_path.read_bytes())
             
         # Setup output directory
         self.base_name = self.analysis_data['video_name']
@@ -56,19 +90,91 @@ class NarrativeGenerator:
             self.progress.update(message)
         logging.info(message)
 
+    async def _call_with_backoff(self, fn, max_attempts: int = 5, base: float = 1.0, **kwargs):
+        """Call an API function, retrying rate-limit and connection errors.
+
+        Sleeps only when the API actually pushes back, honoring any
+        Retry-After header, instead of a fixed delay on every call.
+        """
+        for attempt in range(max_attempts):
+            try:
+                return await fn(**kwargs)
+            except (RateLimitError, APIConnectionError) as e:
+                if attempt == max_attempts - 1:
+                    raise
+                delay = base * 2 ** attempt + random.random()
+                response = getattr(e, 'response', None)
+                retry_after = response.headers.get('retry-after') if response is not None else None
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                logging.warning(f"API error ({e.__class__.__name__}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def _cached_chat(
+        self,
+        messages: List[Dict[str, Any]],
+        on_delta: Optional[Callable[[str], None]] = None,
+        **kwargs
+    ) -> str:
+        """Run a chat completion through the on-disk cache.
+
+        The key is a hash of the messages and request parameters, so any
+        prompt or template change misses the cache naturally. GPT output
+        is non-deterministic anyway, so replaying a cached sample is as
+        valid as a fresh one. When on_delta is given the completion is
+        streamed and each token fragment is forwarded as it arrives.
+        """
+        cache_path = None
+        if self.enable_cache:
+            key = hashlib.sha256(
+                orjson.dumps([messages, kwargs], option=orjson.OPT_SORT_KEYS)
+            ).hexdigest()
+            cache_path = CACHE_DIR / f"{key}.json"
+            if cache_path.exists():
+                content = orjson.loads(cache_path.read_bytes())['content']
+                if on_delta is not None:
+                    on_delta(content)
+                return content
+
+        if on_delta is None:
+            response = await self._call_with_backoff(
+                self.async_client.chat.completions.create,
+                messages=messages,
+                **kwargs
+            )
+            content = response.choices[0].message.content
+        else:
+            stream = await self._call_with_backoff(
+                self.async_client.chat.completions.create,
+                messages=messages,
+                stream=True,
+                **kwargs
+            )
+            parts = []
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    on_delta(delta)
+            content = ''.join(parts)
+
+        if cache_path is not None:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(orjson.dumps({'content': content}))
+
+        return content
+
     def identify_scenes(self) -> List[List[Dict[str, Any]]]:
         """Group frames into coherent scenes"""
         scenes = []
         current_scene = []
         
         for frame in self.analysis_data['frames']:
-            description = frame['narration'].lower()
-            
             # Check for scene transitions
-            is_transition = any(term in description for term in [
-                'moving to', 'entering', 'stepping into', 'next we have',
-                'moving into', 'heading to', 'walking into', 'now in'
-            ])
+            is_transition = bool(self._TRANSITION_RE.search(frame['narration']))
             
             if is_transition and current_scene:
                 scenes.append(current_scene)
@@ -82,89 +188,145 @@ class NarrativeGenerator:
             
         return scenes
 
-    def create_scene_narration(self, scene: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
-        """Generate narration for a scene and return timing data"""
+    def _batch_scenes(self, scenes: List[List[Dict[str, Any]]]) -> List[List[List[Dict[str, Any]]]]:
+        """Group scenes into chunks whose combined prompt stays under budget"""
+        batches = []
+        current: List[List[Dict[str, Any]]] = []
+        current_tokens = 0
+
+        for scene in scenes:
+            # Rough estimate: ~4 characters per token
+            scene_tokens = sum(len(frame['narration']) for frame in scene) // 4
+            if current and (
+                current_tokens + scene_tokens > MAX_BATCH_PROMPT_TOKENS
+                or len(current) >= MAX_SCENES_PER_BATCH
+            ):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(scene)
+            current_tokens += scene_tokens
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    async def _batch_scene_narrate(self, scenes_chunk: List[List[Dict[str, Any]]]) -> List[str]:
+        """Generate narration for several scenes in a single completion"""
         try:
-            # Prepare scene context for GPT
-            scene_start = scene[0]['timestamp']
-            descriptions = [frame['narration'] for frame in scene]
-            
-            scene_context = "\n".join(descriptions)
-            
-            # Get narrative from GPT
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": 
+            sections = []
+            for i, scene in enumerate(scenes_chunk, 1):
+                scene_context = "\n".join(frame['narration'] for frame in scene)
+                sections.append(f"Scene {i}:\n{scene_context}")
+
+            content = await self._cached_chat(
+                [
+                    {"role": "system", "content":
                      "Create flowing, natural narration suitable for text-to-speech. "
                      "Do not include timestamps, stage directions, or technical notes. "
                      f"Use the style specified:\n\n{self.template.narration_prompt}"},
-                    {"role": "user", "content": 
-                     f"Create natural narration from these descriptions:\n\n{scene_context}"}
+                    {"role": "user", "content":
+                     f"Create natural narration for each of the following "
+                     f"{len(scenes_chunk)} scenes. Return JSON of the form "
+                     '{"narrations": ["...", ...]} with one entry per scene, in order.\n\n'
+                     + "\n\n".join(sections)}
                 ],
+                model="gpt-4-turbo-preview",
                 temperature=0.7,
-                max_tokens=500
+                max_tokens=min(500 * len(scenes_chunk), MAX_COMPLETION_TOKENS),
+                response_format={"type": "json_object"}
             )
-            
-            narration = response.choices[0].message.content
-            
-            # Create timing data
-            timing_data = {
-                'start_time': scene_start,
-                'end_time': scene[-1]['timestamp'],
-                'original_descriptions': descriptions
-            }
-            
-            # Add small delay to avoid rate limits
-            time.sleep(0.5)
-            
-            return narration.strip(), timing_data
-            
+
+            narrations = json.loads(content)['narrations']
+            if len(narrations) != len(scenes_chunk):
+                raise ValueError(
+                    f"Expected {len(scenes_chunk)} narrations, got {len(narrations)}"
+                )
+
+            return [narration.strip() for narration in narrations]
+
         except Exception as e:
-            logging.error(f"Error generating scene narration: {str(e)}")
+            logging.error(f"Error generating scene narration batch: {str(e)}")
             raise
 
-    def create_complete_narration(self) -> Tuple[str, List[Dict[str, Any]]]:
+    @staticmethod
+    def _scene_timing(scene: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build timing data for a scene"""
+        return {
+            'start_time': scene[0]['timestamp'],
+            'end_time': scene[-1]['timestamp'],
+            'original_descriptions': [frame['narration'] for frame in scene]
+        }
+
+    def create_complete_narration(
+        self,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Tuple[str, List[Dict[str, Any]]]:
         """Generate complete narration and timing data"""
+        return asyncio.run(self._create_complete_narration_async(on_delta))
+
+    async def _create_complete_narration_async(
+        self,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Generate complete narration and timing data concurrently"""
+        # The client must live and die with this loop: its keep-alive
+        # connections cannot outlive the asyncio.run() that made them
+        self.async_client = get_async_client(self.client.api_key)
         try:
             self.update_progress("Identifying scenes...")
             scenes = self.identify_scenes()
             
-            self.update_progress("Generating narration...")
-            scene_narrations = []
-            timing_data = []
-            
-            for i, scene in enumerate(scenes, 1):
-                self.update_progress(f"Processing scene {i} of {len(scenes)}")
-                narration, timing = self.create_scene_narration(scene)
-                scene_narrations.append(narration)
-                timing_data.append(timing)
+            # Batch scenes per request to stretch RPM quota, then fan the
+            # batches out concurrently; order is preserved on both levels
+            batches = self._batch_scenes(scenes)
+            self.update_progress(
+                f"Generating narration for {len(scenes)} scenes "
+                f"in {len(batches)} batches..."
+            )
+            results = await asyncio.gather(
+                *(self._batch_scene_narrate(batch) for batch in batches)
+            )
+            scene_narrations = [narration for batch in results for narration in batch]
+            timing_data = [self._scene_timing(scene) for scene in scenes]
             
-            # Combine all narrations
-            full_narration = "\n\n".join(scene_narrations)
+            # Short scripts don't benefit from the polish pass; skip the
+            # extra serial round-trip on the critical path
+            total_chars = sum(len(n) for n in scene_narrations)
+            if total_chars // 4 < MIN_POLISH_TOKENS:
+                narration = "\n\n".join(scene_narrations)
+                if on_delta is not None:
+                    on_delta(narration)
+                return narration, timing_data
             
-            # Final polish for flow
+            # Final polish for flow. The joined text is materialized only
+            # inside the request body so the per-scene strings stay the
+            # single copy held across the call
             self.update_progress("Polishing final narration...")
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
+            polished = await self._cached_chat(
+                on_delta=on_delta,
                 messages=[
                     {"role": "system", "content": 
                      "Polish this narration for natural flow and text-to-speech delivery. "
                      "Ensure smooth transitions between paragraphs. "
                      "Do not include any technical notes or timing information."},
-                    {"role": "user", "content": full_narration}
+                    {"role": "user", "content": "\n\n".join(scene_narrations)}
                 ],
+                model="gpt-4-turbo-preview",
                 temperature=0.7,
                 max_tokens=2000
             )
             
-            polished_narration = response.choices[0].message.content.strip()
+            polished_narration = polished.strip()
             
             return polished_narration, timing_data
             
         except Exception as e:
             logging.error(f"Error generating complete narration: {str(e)}")
             raise
+        finally:
+            await self.async_client.close()
 
     def save_timing_data(self, timing_data: List[Dict[str, Any]]) -> str:
         """Save technical timing information"""
@@ -179,16 +341,22 @@ class NarrativeGenerator:
         }
         
         output_path = self.output_dir / f"{self.base_name}_timing.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(timing_info, f, indent=2)
-            
+        output_path.write_bytes(orjson.dumps(timing_info, option=orjson.OPT_INDENT_2))
+
         return str(output_path)
 
-    def generate_script(self) -> Tuple[str, str]:
-        """Generate and save narration files"""
+    def generate_script(
+        self,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Tuple[str, str]:
+        """Generate and save narration files.
+
+        on_delta, when given, receives token fragments of the final
+        narration as they stream in, ahead of the files being written.
+        """
         try:
             # Generate narration
-            narration, timing_data = self.create_complete_narration()
+            narration, timing_data = self.create_complete_narration(on_delta)
             
             # Save clean narration for TTS
             self.update_progress("Saving narration files...")
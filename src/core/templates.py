@@ -3,8 +3,9 @@ Template management for Video Narrator Pro.
 Handles template definitions, customization, and persistence.
 """
 
-import json
 from pathlib import Path
+
+import orjson
 import logging
 from typing import Optional, Dict, List
 from dataclasses import dataclass, asdict
@@ -60,21 +61,14 @@ class Template:
             custom_narration_prompt=data.get('custom_narration_prompt')
         )
 
-class TemplateManager:
-    """Manages template collection and persistence"""
-    
-    def __init__(self):
-        self.templates: Dict[str, Template] = {}
-        self._initialize_defaults()
-        self.load_custom_prompts()
-
-    def _initialize_defaults(self) -> None:
-        """Initialize default templates"""
-        self.templates['room-tour'] = Template(
-            id='room-tour',
-            name='Room Walk-through',
-            description='Perfect for real estate, hotel rooms, and interior tours',
-            default_analysis_prompt="""
+# Default template definitions live here as plain interned strings so
+# importing the module costs nothing; Template objects are only built
+# when a template is actually requested
+_DEFAULTS: Dict[str, Dict[str, str]] = {
+    'room-tour': {
+        'name': 'Room Walk-through',
+        'description': 'Perfect for real estate, hotel rooms, and interior tours',
+        'default_analysis_prompt': """
             Analyze this room as a veteran tour guide would see it. Focus on:
             - Layout and practical use of space
             - Notable features and amenities
@@ -82,18 +76,16 @@ class TemplateManager:
             - Quality of finishes and materials
             Describe it clearly and directly, as if explaining to a friend.
             """.strip(),
-            default_narration_prompt="""
+        'default_narration_prompt': """
             Create a natural, flowing tour narrative connecting these room descriptions.
             Use a straightforward, conversational style appropriate for a veteran narrator.
             Focus on practical details and clear transitions between spaces.
             """.strip()
-        )
-
-        self.templates['outdoor-scene'] = Template(
-            id='outdoor-scene',
-            name='Outdoor Scenes',
-            description='Ideal for nature, landscapes, and exterior property views',
-            default_analysis_prompt="""
+    },
+    'outdoor-scene': {
+        'name': 'Outdoor Scenes',
+        'description': 'Ideal for nature, landscapes, and exterior property views',
+        'default_analysis_prompt': """
             Observe this outdoor scene as an experienced guide would.
             Note key features like:
             - Landscape elements and views
@@ -102,18 +94,16 @@ class TemplateManager:
             - Weather and lighting conditions
             Use clear, straightforward language.
             """.strip(),
-            default_narration_prompt="""
+        'default_narration_prompt': """
             Develop a natural narrative that guides viewers through these outdoor scenes.
             Use direct, clear language that connects different views and locations.
             Focus on notable features and maintain a steady, comfortable pace.
             """.strip()
-        )
-
-        self.templates['event-coverage'] = Template(
-            id='event-coverage',
-            name='Event Coverage',
-            description='Great for ceremonies, gatherings, and special occasions',
-            default_analysis_prompt="""
+    },
+    'event-coverage': {
+        'name': 'Event Coverage',
+        'description': 'Great for ceremonies, gatherings, and special occasions',
+        'default_analysis_prompt': """
             Analyze this event scene focusing on:
             - Key activities and moments
             - People and interactions
@@ -121,18 +111,16 @@ class TemplateManager:
             - Timeline of events
             Describe it clearly and chronologically.
             """.strip(),
-            default_narration_prompt="""
+        'default_narration_prompt': """
             Create a chronological narrative of the event that flows naturally.
             Focus on key moments and transitions.
             Maintain clear timing references while keeping a conversational tone.
             """.strip()
-        )
-
-        self.templates['product-showcase'] = Template(
-            id='product-showcase',
-            name='Product Showcase',
-            description='Suited for product demonstrations and features',
-            default_analysis_prompt="""
+    },
+    'product-showcase': {
+        'name': 'Product Showcase',
+        'description': 'Suited for product demonstrations and features',
+        'default_analysis_prompt': """
             Examine this product scene focusing on:
             - Key features and functions
             - Design elements
@@ -140,42 +128,71 @@ class TemplateManager:
             - Quality and craftsmanship
             Use clear, non-marketing language.
             """.strip(),
-            default_narration_prompt="""
+        'default_narration_prompt': """
             Develop a straightforward narrative about the product's features and benefits.
             Avoid marketing jargon and focus on practical information.
             Create natural transitions between different aspects of the product.
             """.strip()
-        )
+    }
+}
+
+_NAME_TO_ID: Dict[str, str] = {
+    spec['name']: template_id for template_id, spec in _DEFAULTS.items()
+}
+
+class TemplateManager:
+    """Manages template collection and persistence"""
+    
+    def __init__(self):
+        # Templates materialize lazily on first access; only the raw
+        # custom-prompt data is read up front
+        self.templates: Dict[str, Template] = {}
+        self._custom_data: Dict[str, dict] = {}
+        self.load_custom_prompts()
+
+    def _materialize(self, template_id: str) -> Optional[Template]:
+        """Build and cache a template from its default definition"""
+        template = self.templates.get(template_id)
+        if template is None and template_id in _DEFAULTS:
+            template = Template(id=template_id, **_DEFAULTS[template_id])
+            custom = self._custom_data.get(template_id)
+            if custom:
+                template = Template.from_dict(custom, template)
+            self.templates[template_id] = template
+        return template
 
     def get_template(self, template_id: str) -> Optional[Template]:
         """Get template by ID"""
-        return self.templates.get(template_id)
+        return self._materialize(template_id)
 
     def get_template_by_name(self, name: str) -> Optional[Template]:
         """Get template by name"""
-        return next((t for t in self.templates.values() if t.name == name), None)
+        template_id = _NAME_TO_ID.get(name)
+        return self._materialize(template_id) if template_id else None
 
     def get_template_names(self) -> List[str]:
         """Get list of template names"""
-        return [t.name for t in self.templates.values()]
+        return [spec['name'] for spec in _DEFAULTS.values()]
 
     def get_template_descriptions(self) -> Dict[str, str]:
         """Get dictionary of template names and descriptions"""
-        return {t.name: t.description for t in self.templates.values()}
+        return {spec['name']: spec['description'] for spec in _DEFAULTS.values()}
 
     def save_custom_prompts(self) -> None:
         """Save custom prompts to file"""
         try:
-            custom_data = {
-                template_id: template.to_dict()
-                for template_id, template in self.templates.items()
-                if template.is_customized()
-            }
+            # Carry over customizations for templates never materialized
+            # this session, then overlay the live ones
+            custom_data = dict(self._custom_data)
+            for template_id, template in self.templates.items():
+                if template.is_customized():
+                    custom_data[template_id] = template.to_dict()
+                else:
+                    custom_data.pop(template_id, None)
 
             if custom_data:
                 save_path = Path('custom_prompts.json')
-                with open(save_path, 'w', encoding='utf-8') as f:
-                    json.dump(custom_data, f, indent=2)
+                save_path.write_bytes(orjson.dumps(custom_data, option=orjson.OPT_INDENT_2))
                     
         except Exception as e:
             logging.error(f"Error saving custom prompts: {e}")
@@ -188,15 +205,13 @@ class TemplateManager:
             if not load_path.exists():
                 return
 
-            with open(load_path, 'r', encoding='utf-8') as f:
-                custom_data = json.load(f)
+            custom_data = orjson.loads(load_path.read_bytes())
 
-            for template_id, data in custom_data.items():
-                if template_id in self.templates:
-                    default_template = self.templates[template_id]
-                    self.templates[template_id] = Template.from_dict(
-                        data, default_template
-                    )
+            self._custom_data = {
+                template_id: data
+                for template_id, data in custom_data.items()
+                if template_id in _DEFAULTS
+            }
                     
         except Exception as e:
             logging.error(f"Error loading custom prompts: {e}")
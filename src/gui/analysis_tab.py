@@ -5,23 +5,42 @@ Manages video file selection and analysis process with template selection.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import threading
+import asyncio
+import os
+import queue
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import logging
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 from ..core.templates import TemplateManager, Template
 from ..core.video_analyzer import VideoAnalyzer
 from ..utils.progress_tracking import ProgressTracker
+from .async_runner import submit_coro
 from .prompt_editor import PromptEditorDialog
 
+@lru_cache(maxsize=64)
+def _rendered_description(name: str, customized: bool, desc: str) -> str:
+    """Render a template's combobox description once per distinct state"""
+    if customized:
+        return desc + "\n(Using custom prompts)"
+    return desc
+
 class AnalysisTab(ttk.Frame):
+    # Built once; filedialog marshals this straight to Tcl per open
+    VIDEO_FILETYPES = (
+        ("Video files", "*.mp4 *.avi *.mov *.mkv"),
+        ("All files", "*.*")
+    )
+
     def __init__(
         self,
         parent: ttk.Notebook,
         template_manager: TemplateManager,
-        openai_client: OpenAI,
+        openai_client: 'OpenAI',
         progress_tracker: Optional[ProgressTracker] = None
     ):
         super().__init__(parent)
@@ -31,14 +50,31 @@ class AnalysisTab(ttk.Frame):
         self.client = openai_client
         self.progress = progress_tracker
         
+        # Name -> Template cache; combobox events hit this dict instead
+        # of going back to the manager on every selection
+        self._template_index = {}
+        
         # Initialize state variables
         self.video_path_var = tk.StringVar()
         self.output_dir_var = tk.StringVar()
         self.template_var = tk.StringVar()
         self.processing = False
+        self._pending_status = ""
+        self._status_scheduled = False
+        self._last_desc = None
+        
+        # Worker -> UI messages funnel through one queue drained by a
+        # 20 ms poller, one scheduled callback instead of an after(0)
+        # event-loop wakeup per message
+        self._msgq = queue.Queue(maxsize=256)
+        self._dispatch = {
+            'complete': self.analysis_complete,
+            'error': self.analysis_error
+        }
         
         # Create interface
         self.setup_ui()
+        self.after(20, self._pump)
         
     def setup_ui(self):
         """Create the user interface"""
@@ -50,65 +86,62 @@ class AnalysisTab(ttk.Frame):
         template_frame = ttk.LabelFrame(main_frame, text="Template Selection", padding=5)
         template_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Template dropdown and edit button
-        template_row = ttk.Frame(template_frame)
-        template_row.pack(fill=tk.X, pady=5)
+        # Widgets grid directly into the LabelFrame; the old per-row
+        # ttk.Frame wrappers only existed for layout and doubled the
+        # widget count the geometry manager walks on every resize
+        template_frame.grid_columnconfigure(0, weight=1)
         
         self.template_combo = ttk.Combobox(
-            template_row,
+            template_frame,
             textvariable=self.template_var,
             values=self.template_manager.get_template_names(),
             state='readonly'
         )
-        self.template_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.template_combo.grid(row=0, column=0, sticky='ew', pady=5)
         
         ttk.Button(
-            template_row,
+            template_frame,
             text="Edit Template",
             command=self.edit_template
-        ).pack(side=tk.LEFT, padx=(5, 0))
+        ).grid(row=0, column=1, padx=(5, 0), pady=5)
         
         # Template description
         self.desc_label = ttk.Label(template_frame, wraplength=600)
-        self.desc_label.pack(fill=tk.X, pady=5)
+        self.desc_label.grid(row=1, column=0, columnspan=2, sticky='ew', pady=5)
         
         # File Selection
         file_frame = ttk.LabelFrame(main_frame, text="Video Selection", padding=5)
         file_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Video file selection
-        video_row = ttk.Frame(file_frame)
-        video_row.pack(fill=tk.X, pady=5)
+        file_frame.grid_columnconfigure(1, weight=1)
         
+        # Video file selection
         ttk.Entry(
-            video_row,
+            file_frame,
             textvariable=self.video_path_var,
             state='readonly'
-        ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ).grid(row=0, column=0, columnspan=2, sticky='ew', pady=5)
         
         ttk.Button(
-            video_row,
+            file_frame,
             text="Select Video",
             command=self.select_video
-        ).pack(side=tk.LEFT, padx=(5, 0))
+        ).grid(row=0, column=2, padx=(5, 0), pady=5)
         
         # Output directory selection
-        output_row = ttk.Frame(file_frame)
-        output_row.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(output_row, text="Output:").pack(side=tk.LEFT)
+        ttk.Label(file_frame, text="Output:").grid(row=1, column=0, sticky='w', pady=5)
         
         ttk.Entry(
-            output_row,
+            file_frame,
             textvariable=self.output_dir_var,
             state='readonly'
-        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        ).grid(row=1, column=1, sticky='ew', padx=5, pady=5)
         
         ttk.Button(
-            output_row,
+            file_frame,
             text="Select Folder",
             command=self.select_output
-        ).pack(side=tk.LEFT)
+        ).grid(row=1, column=2, pady=5)
         
         # Analysis Controls
         control_frame = ttk.Frame(main_frame)
@@ -145,9 +178,11 @@ class AnalysisTab(ttk.Frame):
         """Handle video file selection"""
         file_path = filedialog.askopenfilename(
             title="Select Video File",
-            filetypes=[("Video files", "*.mp4 *.avi *.mov *.mkv"), ("All files", "*.*")]
+            filetypes=self.VIDEO_FILETYPES
         )
         if file_path:
+            # Pure StringVar updates only: existence checks happen on the
+            # worker side, the UI thread must never touch disk
             self.video_path_var.set(file_path)
             # Set default output directory
             if not self.output_dir_var.get():
@@ -159,13 +194,38 @@ class AnalysisTab(ttk.Frame):
         if directory:
             self.output_dir_var.set(directory)
             
+    def _ensure_template_index(self):
+        """Build the name -> Template cache on first use"""
+        if not self._template_index:
+            for name in self.template_manager.get_template_names():
+                self._template_index[name] = \
+                    self.template_manager.get_template_by_name(name)
+        return self._template_index
+
+    def _selected_template(self):
+        """Look up the currently selected template from the cache"""
+        return self._ensure_template_index().get(self.template_var.get())
+
+    def refresh_templates(self, template_manager=None):
+        """Rebuild the template cache and combobox after a reset"""
+        if template_manager is not None:
+            self.template_manager = template_manager
+        self._template_index = {}
+        _rendered_description.cache_clear()
+        self.template_combo.config(
+            values=self.template_manager.get_template_names()
+        )
+        self.template_var.set("")
+        self._last_desc = None
+        self.desc_label.config(text="")
+
     def edit_template(self):
         """Open template editor"""
         if not self.template_var.get():
             messagebox.showinfo("Template Required", "Please select a template first")
             return
             
-        template = self.template_manager.get_template_by_name(self.template_var.get())
+        template = self._selected_template()
         if template:
             editor = PromptEditorDialog(self, template)
             if editor.show():
@@ -173,17 +233,33 @@ class AnalysisTab(ttk.Frame):
                 
     def update_template_info(self, event=None):
         """Update template description display"""
-        template = self.template_manager.get_template_by_name(self.template_var.get())
+        template = self._selected_template()
         if template:
-            desc = template.description
-            if template.is_customized():
-                desc += "\n(Using custom prompts)"
+            desc = _rendered_description(
+                template.name,
+                template.is_customized(),
+                template.description
+            )
+            # Re-selecting the same template shouldn't trigger the
+            # relayout a wraplength'd label performs on every config
+            if desc == self._last_desc:
+                return
+            self._last_desc = desc
             self.desc_label.config(text=desc)
             
     def update_status(self, message: str):
         """Update status display"""
-        self.status_label.config(text=message)
-        self.status_label.update()
+        # Coalesce bursts: only the latest message is painted per idle
+        # pass instead of forcing a synchronous redraw on every write
+        self._pending_status = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Apply the most recent status message"""
+        self._status_scheduled = False
+        self.status_label.config(text=self._pending_status)
         
     def start_analysis(self):
         """Begin video analysis process"""
@@ -195,7 +271,7 @@ class AnalysisTab(ttk.Frame):
             return
             
         # Get template
-        template = self.template_manager.get_template_by_name(self.template_var.get())
+        template = self._selected_template()
         
         # Update UI state
         self.processing = True
@@ -205,17 +281,15 @@ class AnalysisTab(ttk.Frame):
         if self.progress:
             self.progress.show()
             
-        # Start analysis thread
-        self.analysis_thread = threading.Thread(
-            target=self.run_analysis,
-            args=(
+        # Schedule analysis on the shared background loop; keeping the
+        # future around makes a cancel button a one-liner later
+        self.analysis_future = submit_coro(
+            self.run_analysis(
                 self.video_path_var.get(),
                 template,
                 self.output_dir_var.get()
             )
         )
-        self.analysis_thread.daemon = True
-        self.analysis_thread.start()
         
     def validate_inputs(self) -> bool:
         """Validate all required inputs"""
@@ -233,23 +307,54 @@ class AnalysisTab(ttk.Frame):
             
         return True
         
-    def run_analysis(self, video_path: str, template: Template, output_dir: str):
-        """Run analysis in separate thread"""
+    async def run_analysis(self, video_path: str, template: Template, output_dir: str):
+        """Run analysis as a background task"""
         try:
-            with VideoAnalyzer(
-                video_path,
-                template,
-                self.client,
-                self.progress,
-                output_dir
-            ) as analyzer:
-                result_path = analyzer.analyze_video()
-                
-            self.after(0, self.analysis_complete, result_path)
+            # Validate the input here rather than in the file picker so a
+            # slow network drive can't stall the UI thread
+            try:
+                os.stat(video_path)
+            except OSError as e:
+                self._msgq.put(('error', f"Cannot read video file: {e}"))
+                return
+
+            # The analyzer drives its own request pipeline internally;
+            # keep its blocking entry point off the event loop
+            def work():
+                with VideoAnalyzer(
+                    video_path,
+                    template,
+                    self.client,
+                    self.progress,
+                    output_dir
+                ) as analyzer:
+                    return analyzer.analyze_video()
+
+            loop = asyncio.get_running_loop()
+            result_path = await loop.run_in_executor(None, work)
+
+            self._msgq.put(('complete', result_path))
             
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            self.after(0, self.analysis_error, str(e))
+            self._msgq.put(('error', str(e)))
             
+    def _pump(self):
+        """Drain worker messages, a bounded batch per tick"""
+        # The reschedule lives in a finally so a handler raising can
+        # never kill the pump and strand the tab mid-operation
+        try:
+            for _ in range(64):
+                kind, *args = self._msgq.get_nowait()
+                self._dispatch[kind](*args)
+        except queue.Empty:
+            pass
+        except Exception:
+            logging.exception("Error handling worker message")
+        finally:
+            self.after(20, self._pump)
+
     def analysis_complete(self, result_path: str):
         """Handle successful analysis completion"""
         self.processing = False
@@ -271,18 +376,20 @@ class AnalysisTab(ttk.Frame):
         self.add_result(f"Error during analysis:\n{error_message}")
         messagebox.showerror("Analysis Error", error_message)
         
+    @staticmethod
+    def _set_text(widget, new_text: str):
+        """Replace a read-only Text widget's content in one state toggle"""
+        widget.configure(state=tk.NORMAL)
+        widget.replace('1.0', tk.END, new_text)
+        widget.configure(state=tk.DISABLED)
+
     def add_result(self, message: str):
         """Add message to results display"""
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, message)
-        self.results_text.config(state=tk.DISABLED)
+        self._set_text(self.results_text, message)
         
     def clear_results(self):
         """Clear results display"""
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.config(state=tk.DISABLED)
+        self._set_text(self.results_text, "")
         
     def reset(self):
         """Reset tab to initial state"""
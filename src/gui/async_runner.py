@@ -0,0 +1,43 @@
+"""
+Background asyncio loop for Video Narrator Pro's GUI.
+Runs long analysis and generation work as cancellable tasks off the Tk thread.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_started = threading.Event()
+
+def _run_loop() -> None:
+    global _loop
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    # One reusable worker pool for the blocking analyzer/generator
+    # entry points: threads (and their TLS/logger state) persist across
+    # runs instead of being created per run
+    _loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=2, thread_name_prefix="vnp-worker")
+    )
+    _started.set()
+    _loop.run_forever()
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use"""
+    global _thread
+    if _thread is None:
+        _thread = threading.Thread(target=_run_loop, name="vnp-async", daemon=True)
+        _thread.start()
+        _started.wait()
+    return _loop
+
+def submit_coro(coro):
+    """Schedule a coroutine on the shared loop from any thread.
+
+    Returns a concurrent.futures.Future, so callers can cancel the task
+    or attach done callbacks from the Tk side.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
@@ -6,18 +6,67 @@ Manages application initialization, layout, and tab coordination.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import logging.handlers
+import queue
+import threading
 from pathlib import Path
-from dotenv import load_dotenv
 import os
-from openai import OpenAI
 
 from ..core.templates import TemplateManager
 from ..utils.progress_tracking import ProgressTracker
-from .analysis_tab import AnalysisTab
-from .narration_tab import NarrationTab
+
+# ttk styles are process-global; configure them once, not per window
+_STYLES_CONFIGURED = False
+
+def _load_env_cached():
+    """Apply .env variables, skipping the parse when a cached copy is fresh.
+
+    The parsed mapping is pickled keyed on the file's mtime; startup
+    after an unchanged .env becomes a single stat plus unpickle instead
+    of a regex parse. Existing environment variables are never
+    overridden, matching load_dotenv's defaults.
+    """
+    import pickle
+    
+    try:
+        mtime = os.stat('.env').st_mtime
+    except OSError:
+        return
+    
+    cache_path = Path.home() / '.cache' / 'vnp_env.pkl'
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_mtime, values = pickle.load(f)
+        if cached_mtime == mtime:
+            for key, value in values.items():
+                os.environ.setdefault(key, value)
+            return
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        pass
+    
+    from dotenv import dotenv_values
+    values = {
+        key: value
+        for key, value in dotenv_values('.env').items()
+        if value is not None
+    }
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # The cache holds the API key, so the file must be owner-only
+        # from the moment it exists, not chmod'd after the fact
+        fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((mtime, values), f)
+    except OSError:
+        pass
 
 class MainWindow:
     def __init__(self):
+        self._pending_status = ""
+        self._status_scheduled = False
         self.setup_logging()
         self.initialize_app()
         self.create_gui()
@@ -29,19 +78,37 @@ class MainWindow:
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_dir / "app.log"),
-                logging.StreamHandler()
-            ]
+        # Records go onto an in-memory queue; the listener thread does
+        # the actual file/console I/O, so a logging call from the UI
+        # thread is an O(1) put and never waits on disk
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_dir / "app.log")
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue,
+            file_handler,
+            stream_handler,
+            respect_handler_level=True
         )
+        self._log_listener.start()
         
     def initialize_app(self):
         """Initialize application settings and dependencies"""
+        # Deferred imports: openai pulls in a large pydantic model tree,
+        # so keep it off the path to the first window paint
+        import httpx
+        from openai import OpenAI
+        
         # Load environment variables
-        load_dotenv()
+        _load_env_cached()
         
         # Initialize OpenAI client
         api_key = os.getenv('OPENAI_API_KEY')
@@ -52,7 +119,29 @@ class MainWindow:
             )
             raise SystemExit
             
-        self.openai_client = OpenAI(api_key=api_key)
+        # One keep-alive HTTP/2 pool shared by every completion the
+        # tabs make, instead of paying TCP/TLS setup per request
+        # http2/limits must go on the transport: httpx only applies
+        # them to the transport it builds itself, so passing them to
+        # Client alongside an explicit transport silently drops them
+        self.http_client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                retries=2,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32
+                )
+            )
+        )
+        # Transient 429/5xx failures retry inside the SDK with
+        # exponential backoff instead of aborting a multi-minute job
+        self.openai_client = OpenAI(
+            api_key=api_key,
+            max_retries=6,
+            timeout=60.0,
+            http_client=self.http_client
+        )
         
         # Initialize template manager
         self.template_manager = TemplateManager()
@@ -78,8 +167,16 @@ class MainWindow:
         # Create tabs
         self.create_tabs()
         
+        # Close pooled connections when the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
     def setup_styles(self):
         """Configure ttk styles for consistent look"""
+        global _STYLES_CONFIGURED
+        if _STYLES_CONFIGURED:
+            return
+        _STYLES_CONFIGURED = True
+        
         style = ttk.Style()
         
         # General styles
@@ -109,35 +206,57 @@ class MainWindow:
         )
         
     def create_menu(self):
-        """Create application menu bar"""
+        """Create application menu bar with lazily populated menus"""
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="New Project", command=self.new_project)
-        file_menu.add_command(label="Open Project", command=self.open_project)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-        
-        # Templates menu
-        template_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Templates", menu=template_menu)
-        template_menu.add_command(
+        # Menus stay empty until first opened; postcommand fires right
+        # before display, and the guard set makes repeats free
+        self._menus_built = set()
+        
+        self.file_menu = tk.Menu(
+            menubar, tearoff=0, postcommand=self._populate_file_menu
+        )
+        menubar.add_cascade(label="File", menu=self.file_menu)
+        
+        self.template_menu = tk.Menu(
+            menubar, tearoff=0, postcommand=self._populate_templates_menu
+        )
+        menubar.add_cascade(label="Templates", menu=self.template_menu)
+        
+        self.help_menu = tk.Menu(
+            menubar, tearoff=0, postcommand=self._populate_help_menu
+        )
+        menubar.add_cascade(label="Help", menu=self.help_menu)
+        
+    def _populate_file_menu(self):
+        if 'file' in self._menus_built:
+            return
+        self._menus_built.add('file')
+        self.file_menu.add_command(label="New Project", command=self.new_project)
+        self.file_menu.add_command(label="Open Project", command=self.open_project)
+        self.file_menu.add_separator()
+        self.file_menu.add_command(label="Exit", command=self.root.quit)
+        
+    def _populate_templates_menu(self):
+        if 'templates' in self._menus_built:
+            return
+        self._menus_built.add('templates')
+        self.template_menu.add_command(
             label="Manage Templates",
             command=self.manage_templates
         )
-        template_menu.add_command(
+        self.template_menu.add_command(
             label="Reset to Defaults",
             command=self.reset_templates
         )
         
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="Documentation", command=self.show_docs)
-        help_menu.add_command(label="About", command=self.show_about)
+    def _populate_help_menu(self):
+        if 'help' in self._menus_built:
+            return
+        self._menus_built.add('help')
+        self.help_menu.add_command(label="Documentation", command=self.show_docs)
+        self.help_menu.add_command(label="About", command=self.show_about)
         
     def create_status_bar(self):
         """Create status bar at bottom of window"""
@@ -158,47 +277,89 @@ class MainWindow:
         )
         
     def create_tabs(self):
-        """Create and initialize application tabs"""
+        """Create application tabs, building each lazily on first view"""
         # Create shared progress tracker
         self.progress_tracker = ProgressTracker(
             self.progress_bar,
             self.status_label
         )
         
-        # Analysis tab
+        # Placeholder frames keep startup cheap; the real widget trees
+        # are built on the first <<NotebookTabChanged>> for each index
+        self.analysis_tab = None
+        self.narration_tab = None
+        self._tab_factories = {
+            0: self._build_analysis_tab,
+            1: self._build_narration_tab
+        }
+        
+        self.notebook.add(ttk.Frame(self.notebook), text="Video Analysis")
+        self.notebook.add(ttk.Frame(self.notebook), text="Generate Narration")
+        self.notebook.bind('<<NotebookTabChanged>>', self._materialize_tab)
+        
+        # The first tab is already selected, so build it now
+        self._materialize_tab()
+        
+    def _build_analysis_tab(self):
+        from .analysis_tab import AnalysisTab
         self.analysis_tab = AnalysisTab(
             self.notebook,
             self.template_manager,
             self.openai_client,
             self.progress_tracker
         )
-        self.notebook.add(
-            self.analysis_tab,
-            text="Video Analysis"
-        )
+        return self.analysis_tab
         
-        # Narration tab
+    def _build_narration_tab(self):
+        from .narration_tab import NarrationTab
         self.narration_tab = NarrationTab(
             self.notebook,
             self.template_manager,
             self.openai_client,
             self.progress_tracker
         )
-        self.notebook.add(
-            self.narration_tab,
-            text="Generate Narration"
-        )
-        
+        return self.narration_tab
+        
+    def _materialize_tab(self, event=None):
+        """Swap in the real tab widgets the first time a tab is shown"""
+        index = self.notebook.index('current')
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+            
+        text = self.notebook.tab(index, 'text')
+        placeholder = self.notebook.nametowidget(self.notebook.tabs()[index])
+        real_tab = factory()
+        self.notebook.forget(index)
+        self.notebook.insert(index, real_tab, text=text)
+        placeholder.destroy()
+        self.notebook.select(index)
+        
+    def on_close(self):
+        """Shut down shared resources and close the window"""
+        self.http_client.close()
+        self._log_listener.stop()
+        self.root.destroy()
+
     def update_status(self, message: str):
         """Update status bar message"""
-        self.status_label.config(text=message)
-        self.root.update_idletasks()
+        # Coalesce bursts: only the latest message is painted per idle pass
+        self._pending_status = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Apply the most recent status message"""
+        self._status_scheduled = False
+        self.status_label.config(text=self._pending_status)
         
     def new_project(self):
         """Handle new project creation"""
-        # Clear existing data
-        self.analysis_tab.reset()
-        self.narration_tab.reset()
+        # Clear existing data; tabs not yet materialized have no state
+        for tab in (self.analysis_tab, self.narration_tab):
+            if tab is not None:
+                tab.reset()
         self.update_status("New project created")
         
     def open_project(self):
@@ -218,8 +379,9 @@ class MainWindow:
             "Reset all templates to default settings? Custom prompts will be lost."
         ):
             self.template_manager = TemplateManager()
-            self.analysis_tab.refresh_templates()
-            self.narration_tab.refresh_templates()
+            for tab in (self.analysis_tab, self.narration_tab):
+                if tab is not None:
+                    tab.refresh_templates(self.template_manager)
             self.update_status("Templates reset to defaults")
             
     def show_docs(self):
@@ -239,9 +401,17 @@ class MainWindow:
         """Start the application"""
         self.root.mainloop()
         
+def _prewarm_imports():
+    """Import the heavy API dependencies off the main thread"""
+    import openai  # noqa: F401
+    import httpx  # noqa: F401
+
 def main():
     """Application entry point"""
     try:
+        # Overlap the openai/httpx import cost with logging setup and
+        # window construction instead of paying it serially first
+        threading.Thread(target=_prewarm_imports, daemon=True).start()
         app = MainWindow()
         app.run()
     except Exception as e:
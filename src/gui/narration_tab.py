@@ -5,23 +5,42 @@ Handles generation of clean narration scripts suitable for text-to-speech.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import threading
+import asyncio
+import os
+import queue
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import logging
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 from ..core.templates import TemplateManager, Template
 from ..core.narrative_generator import NarrativeGenerator
 from ..utils.progress_tracking import ProgressTracker
+from .async_runner import submit_coro
 from .prompt_editor import PromptEditorDialog
 
+@lru_cache(maxsize=64)
+def _rendered_description(name: str, customized: bool, desc: str) -> str:
+    """Render a template's combobox description once per distinct state"""
+    if customized:
+        return desc + "\n(Using custom prompts)"
+    return desc
+
 class NarrationTab(ttk.Frame):
+    # Built once; filedialog marshals this straight to Tcl per open
+    ANALYSIS_FILETYPES = (
+        ("JSON files", "*.json"),
+        ("All files", "*.*")
+    )
+
     def __init__(
         self,
         parent: ttk.Notebook,
         template_manager: TemplateManager,
-        openai_client: OpenAI,
+        openai_client: 'OpenAI',
         progress_tracker: Optional[ProgressTracker] = None
     ):
         super().__init__(parent)
@@ -31,14 +50,35 @@ class NarrationTab(ttk.Frame):
         self.client = openai_client
         self.progress = progress_tracker
         
+        # Name -> Template cache; combobox events hit this dict instead
+        # of going back to the manager on every selection
+        self._template_index = {}
+        
         # Initialize state variables
         self.analysis_path_var = tk.StringVar()
         self.output_dir_var = tk.StringVar()
         self.template_var = tk.StringVar()
         self.processing = False
+        self._pending_status = ""
+        self._status_scheduled = False
+        self._last_desc = None
+        self._preview_queue = queue.Queue()
+        self._preview_buf = []
+        self._preview_buf_len = 0
+        
+        # Worker -> UI messages funnel through one queue drained by a
+        # 20 ms poller; with token streaming this avoids an after(0)
+        # event-loop wakeup per fragment
+        self._msgq = queue.Queue(maxsize=256)
+        self._dispatch = {
+            'complete': self.generation_complete,
+            'error': self.generation_error,
+            'delta': self._append_preview
+        }
         
         # Create interface
         self.setup_ui()
+        self.after(20, self._pump)
         
     def setup_ui(self):
         """Create the user interface"""
@@ -50,65 +90,62 @@ class NarrationTab(ttk.Frame):
         template_frame = ttk.LabelFrame(main_frame, text="Narration Style", padding=5)
         template_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Template dropdown and edit button
-        template_row = ttk.Frame(template_frame)
-        template_row.pack(fill=tk.X, pady=5)
+        # Widgets grid directly into the LabelFrame; the old per-row
+        # ttk.Frame wrappers only existed for layout and doubled the
+        # widget count the geometry manager walks on every resize
+        template_frame.grid_columnconfigure(0, weight=1)
         
         self.template_combo = ttk.Combobox(
-            template_row,
+            template_frame,
             textvariable=self.template_var,
             values=self.template_manager.get_template_names(),
             state='readonly'
         )
-        self.template_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.template_combo.grid(row=0, column=0, sticky='ew', pady=5)
         
         ttk.Button(
-            template_row,
+            template_frame,
             text="Edit Template",
             command=self.edit_template
-        ).pack(side=tk.LEFT, padx=(5, 0))
+        ).grid(row=0, column=1, padx=(5, 0), pady=5)
         
         # Template description
         self.desc_label = ttk.Label(template_frame, wraplength=600)
-        self.desc_label.pack(fill=tk.X, pady=5)
+        self.desc_label.grid(row=1, column=0, columnspan=2, sticky='ew', pady=5)
         
         # File Selection
         file_frame = ttk.LabelFrame(main_frame, text="Analysis Results", padding=5)
         file_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Analysis file selection
-        analysis_row = ttk.Frame(file_frame)
-        analysis_row.pack(fill=tk.X, pady=5)
+        file_frame.grid_columnconfigure(1, weight=1)
         
+        # Analysis file selection
         ttk.Entry(
-            analysis_row,
+            file_frame,
             textvariable=self.analysis_path_var,
             state='readonly'
-        ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ).grid(row=0, column=0, columnspan=2, sticky='ew', pady=5)
         
         ttk.Button(
-            analysis_row,
+            file_frame,
             text="Select Analysis",
             command=self.select_analysis
-        ).pack(side=tk.LEFT, padx=(5, 0))
+        ).grid(row=0, column=2, padx=(5, 0), pady=5)
         
         # Output directory selection
-        output_row = ttk.Frame(file_frame)
-        output_row.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(output_row, text="Output:").pack(side=tk.LEFT)
+        ttk.Label(file_frame, text="Output:").grid(row=1, column=0, sticky='w', pady=5)
         
         ttk.Entry(
-            output_row,
+            file_frame,
             textvariable=self.output_dir_var,
             state='readonly'
-        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        ).grid(row=1, column=1, sticky='ew', padx=5, pady=5)
         
         ttk.Button(
-            output_row,
+            file_frame,
             text="Select Folder",
             command=self.select_output
-        ).pack(side=tk.LEFT)
+        ).grid(row=1, column=2, pady=5)
         
         # Generation Controls
         control_frame = ttk.Frame(main_frame)
@@ -156,9 +193,11 @@ class NarrationTab(ttk.Frame):
         """Handle analysis file selection"""
         file_path = filedialog.askopenfilename(
             title="Select Analysis Results",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=self.ANALYSIS_FILETYPES
         )
         if file_path:
+            # Pure StringVar updates only: existence checks happen on the
+            # worker side, the UI thread must never touch disk
             self.analysis_path_var.set(file_path)
             # Set default output directory
             if not self.output_dir_var.get():
@@ -170,13 +209,38 @@ class NarrationTab(ttk.Frame):
         if directory:
             self.output_dir_var.set(directory)
             
+    def _ensure_template_index(self):
+        """Build the name -> Template cache on first use"""
+        if not self._template_index:
+            for name in self.template_manager.get_template_names():
+                self._template_index[name] = \
+                    self.template_manager.get_template_by_name(name)
+        return self._template_index
+
+    def _selected_template(self):
+        """Look up the currently selected template from the cache"""
+        return self._ensure_template_index().get(self.template_var.get())
+
+    def refresh_templates(self, template_manager=None):
+        """Rebuild the template cache and combobox after a reset"""
+        if template_manager is not None:
+            self.template_manager = template_manager
+        self._template_index = {}
+        _rendered_description.cache_clear()
+        self.template_combo.config(
+            values=self.template_manager.get_template_names()
+        )
+        self.template_var.set("")
+        self._last_desc = None
+        self.desc_label.config(text="")
+
     def edit_template(self):
         """Open template editor"""
         if not self.template_var.get():
             messagebox.showinfo("Template Required", "Please select a template first")
             return
             
-        template = self.template_manager.get_template_by_name(self.template_var.get())
+        template = self._selected_template()
         if template:
             editor = PromptEditorDialog(self, template)
             if editor.show():
@@ -184,17 +248,33 @@ class NarrationTab(ttk.Frame):
                 
     def update_template_info(self, event=None):
         """Update template description display"""
-        template = self.template_manager.get_template_by_name(self.template_var.get())
+        template = self._selected_template()
         if template:
-            desc = template.description
-            if template.is_customized():
-                desc += "\n(Using custom prompts)"
+            desc = _rendered_description(
+                template.name,
+                template.is_customized(),
+                template.description
+            )
+            # Re-selecting the same template shouldn't trigger the
+            # relayout a wraplength'd label performs on every config
+            if desc == self._last_desc:
+                return
+            self._last_desc = desc
             self.desc_label.config(text=desc)
             
     def update_status(self, message: str):
         """Update status display"""
-        self.status_label.config(text=message)
-        self.status_label.update()
+        # Coalesce bursts: only the latest message is painted per idle
+        # pass instead of forcing a synchronous redraw on every write
+        self._pending_status = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Apply the most recent status message"""
+        self._status_scheduled = False
+        self.status_label.config(text=self._pending_status)
         
     def start_generation(self):
         """Begin narration generation process"""
@@ -206,7 +286,7 @@ class NarrationTab(ttk.Frame):
             return
             
         # Get template
-        template = self.template_manager.get_template_by_name(self.template_var.get())
+        template = self._selected_template()
         
         # Update UI state
         self.processing = True
@@ -216,17 +296,15 @@ class NarrationTab(ttk.Frame):
         if self.progress:
             self.progress.show()
             
-        # Start generation thread
-        self.generation_thread = threading.Thread(
-            target=self.run_generation,
-            args=(
+        # Schedule generation on the shared background loop; keeping the
+        # future around makes a cancel button a one-liner later
+        self.generation_future = submit_coro(
+            self.run_generation(
                 self.analysis_path_var.get(),
                 template,
                 self.output_dir_var.get()
             )
         )
-        self.generation_thread.daemon = True
-        self.generation_thread.start()
         
     def validate_inputs(self) -> bool:
         """Validate all required inputs"""
@@ -244,23 +322,75 @@ class NarrationTab(ttk.Frame):
             
         return True
         
-    def run_generation(self, analysis_path: str, template: Template, output_dir: str):
-        """Run generation in separate thread"""
+    async def run_generation(self, analysis_path: str, template: Template, output_dir: str):
+        """Run generation as a background task"""
         try:
-            with NarrativeGenerator(
-                analysis_path,
-                template,
-                self.client,
-                self.progress,
-                output_dir
-            ) as generator:
-                narration_path, timing_path = generator.generate_script()
-                
-            self.after(0, self.generation_complete, narration_path, timing_path)
+            # Validate the input here rather than in the file picker so a
+            # slow network drive can't stall the UI thread
+            try:
+                os.stat(analysis_path)
+            except OSError as e:
+                self._msgq.put(('error', f"Cannot read analysis file: {e}"))
+                return
+
+            # The generator drives its own request batching internally;
+            # keep its blocking entry point off the event loop
+            def work():
+                with NarrativeGenerator(
+                    analysis_path,
+                    template,
+                    self.client,
+                    self.progress,
+                    output_dir
+                ) as generator:
+                    # Stream tokens into the preview as they arrive so
+                    # text appears within the first second of the polish
+                    # pass rather than after the full completion
+                    paths = generator.generate_script(
+                        on_delta=lambda delta:
+                            self._msgq.put(('delta', delta))
+                    )
+
+                # Read the script here on the worker thread so the UI
+                # thread only ever inserts chunks already in memory
+                try:
+                    with open(paths[0], 'r', encoding='utf-8') as f:
+                        while True:
+                            chunk = f.read(65536)
+                            if not chunk:
+                                break
+                            self._preview_queue.put(chunk)
+                except Exception as e:
+                    logging.error(f"Error loading preview: {e}")
+                self._preview_queue.put(None)
+
+                return paths
+
+            loop = asyncio.get_running_loop()
+            narration_path, timing_path = await loop.run_in_executor(None, work)
+
+            self._msgq.put(('complete', narration_path, timing_path))
             
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            self.after(0, self.generation_error, str(e))
+            self._msgq.put(('error', str(e)))
             
+    def _pump(self):
+        """Drain worker messages, a bounded batch per tick"""
+        # The reschedule lives in a finally so a handler raising can
+        # never kill the pump and strand the tab mid-operation
+        try:
+            for _ in range(64):
+                kind, *args = self._msgq.get_nowait()
+                self._dispatch[kind](*args)
+        except queue.Empty:
+            pass
+        except Exception:
+            logging.exception("Error handling worker message")
+        finally:
+            self.after(20, self._pump)
+
     def generation_complete(self, narration_path: str, timing_path: str):
         """Handle successful generation completion"""
         self.processing = False
@@ -269,14 +399,11 @@ class NarrationTab(ttk.Frame):
         if self.progress:
             self.progress.hide()
             
-        # Show narration preview
-        try:
-            with open(narration_path, 'r', encoding='utf-8') as f:
-                narration_text = f.read()
-            self.set_preview(narration_text)
-        except Exception as e:
-            logging.error(f"Error loading preview: {e}")
-            
+        # Replace the live-streamed draft with the saved script; each
+        # tick inserts a few chunks and yields back to the event loop
+        self.clear_preview()
+        self.after(10, self._drain_preview_queue)
+
         self.update_status("Generation complete!")
         messagebox.showinfo(
             "Generation Complete",
@@ -295,18 +422,55 @@ class NarrationTab(ttk.Frame):
         self.update_status("Error during generation")
         messagebox.showerror("Generation Error", error_message)
         
+    def _append_preview(self, delta: str):
+        """Append a streamed token fragment to the preview"""
+        self.preview_text.configure(state=tk.NORMAL)
+        self.preview_text.insert(tk.END, delta)
+        self.preview_text.configure(state=tk.DISABLED)
+
+    def _drain_preview_queue(self):
+        """Collect queued preview chunks, flushing in large batches"""
+        try:
+            for _ in range(4):
+                chunk = self._preview_queue.get_nowait()
+                if chunk is None:
+                    self._flush_preview_buf()
+                    return
+                # Buffer until ~256 KB so the Text widget rebuilds its
+                # internal indices once per flush, not once per chunk
+                self._preview_buf.append(chunk)
+                self._preview_buf_len += len(chunk)
+                if self._preview_buf_len >= 256_000:
+                    self._flush_preview_buf()
+        except queue.Empty:
+            pass
+        self.after(10, self._drain_preview_queue)
+
+    def _flush_preview_buf(self):
+        """Append the buffered chunks to the preview in one insert"""
+        if not self._preview_buf:
+            return
+        text = ''.join(self._preview_buf)
+        self._preview_buf.clear()
+        self._preview_buf_len = 0
+        self.preview_text.configure(state=tk.NORMAL)
+        self.preview_text.insert(tk.END, text)
+        self.preview_text.configure(state=tk.DISABLED)
+
+    @staticmethod
+    def _set_text(widget, new_text: str):
+        """Replace a read-only Text widget's content in one state toggle"""
+        widget.configure(state=tk.NORMAL)
+        widget.replace('1.0', tk.END, new_text)
+        widget.configure(state=tk.DISABLED)
+
     def set_preview(self, text: str):
         """Update preview text"""
-        self.preview_text.config(state=tk.NORMAL)
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(tk.END, text)
-        self.preview_text.config(state=tk.DISABLED)
+        self._set_text(self.preview_text, text)
         
     def clear_preview(self):
         """Clear preview text"""
-        self.preview_text.config(state=tk.NORMAL)
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.config(state=tk.DISABLED)
+        self._set_text(self.preview_text, "")
         
     def reset(self):
         """Reset tab to initial state"""
@@ -1,4 +1,164 @@
-[Previous code remains exactly the same until select_output_directory method...]
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import threading
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+from openai import OpenAI
+
+from .templates import TemplateManager
+from .app_utils import ProgressTracker, configure_styles
+from .video_analyzer import VideoAnalyzer
+from .narrative_generator import NarrativeGenerator
+
+class VideoNarratorApp:
+    def __init__(self):
+        # Load API credentials
+        load_dotenv()
+        api_key = os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            raise SystemExit("OpenAI API key not found. Add it to your .env file.")
+        self.client = OpenAI(api_key=api_key)
+
+        self.template_manager = TemplateManager()
+
+        # Main window
+        self.root = tk.Tk()
+        self.root.title("Video Narrator")
+        self.root.geometry("800x600")
+        configure_styles()
+
+        # State variables
+        self.video_path_var = tk.StringVar()
+        self.analysis_template_var = tk.StringVar()
+        self.analysis_output_var = tk.StringVar()
+        self.json_path_var = tk.StringVar()
+        self.narration_template_var = tk.StringVar()
+        self.narration_output_var = tk.StringVar()
+
+        self.setup_ui()
+
+        # Workers only enqueue progress messages; this timer applies
+        # them from the Tk thread so widgets are never touched from a
+        # worker (see ProgressTracker)
+        self.analysis_tracker = ProgressTracker(
+            self.analysis_progress, self.analysis_status
+        )
+        self.narration_tracker = ProgressTracker(
+            self.narration_progress, self.narration_status
+        )
+        self.root.after(100, self._drain_progress)
+
+    def setup_ui(self):
+        """Build the analysis and narration sections"""
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Analysis section
+        analysis_frame = ttk.LabelFrame(main_frame, text="Video Analysis", padding=10)
+        analysis_frame.pack(fill=tk.X, pady=(0, 10))
+
+        video_row = ttk.Frame(analysis_frame)
+        video_row.pack(fill=tk.X, pady=5)
+        ttk.Entry(
+            video_row, textvariable=self.video_path_var, state='readonly'
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(
+            video_row, text="Select Video", command=self.select_video_file
+        ).pack(side=tk.LEFT, padx=(5, 0))
+
+        analysis_options = ttk.Frame(analysis_frame)
+        analysis_options.pack(fill=tk.X, pady=5)
+        ttk.Combobox(
+            analysis_options,
+            textvariable=self.analysis_template_var,
+            values=self.template_manager.get_template_names(),
+            state='readonly'
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(
+            analysis_options,
+            text="Select Output",
+            command=lambda: self.select_output_directory('analysis')
+        ).pack(side=tk.LEFT, padx=(5, 0))
+
+        self.analyze_button = ttk.Button(
+            analysis_frame, text="Start Analysis", command=self.start_analysis
+        )
+        self.analyze_button.pack(anchor=tk.E, pady=5)
+
+        self.analysis_progress_frame = ttk.Frame(analysis_frame)
+        self.analysis_status = ttk.Label(self.analysis_progress_frame, text="")
+        self.analysis_progress = ttk.Progressbar(
+            self.analysis_progress_frame, mode='indeterminate'
+        )
+
+        # Narration section
+        narration_frame = ttk.LabelFrame(
+            main_frame, text="Narration Generation", padding=10
+        )
+        narration_frame.pack(fill=tk.X)
+
+        json_row = ttk.Frame(narration_frame)
+        json_row.pack(fill=tk.X, pady=5)
+        ttk.Entry(
+            json_row, textvariable=self.json_path_var, state='readonly'
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(
+            json_row, text="Select Analysis", command=self.select_json_file
+        ).pack(side=tk.LEFT, padx=(5, 0))
+
+        narration_options = ttk.Frame(narration_frame)
+        narration_options.pack(fill=tk.X, pady=5)
+        ttk.Combobox(
+            narration_options,
+            textvariable=self.narration_template_var,
+            values=self.template_manager.get_template_names(),
+            state='readonly'
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(
+            narration_options,
+            text="Select Output",
+            command=lambda: self.select_output_directory('narration')
+        ).pack(side=tk.LEFT, padx=(5, 0))
+
+        self.generate_button = ttk.Button(
+            narration_frame, text="Generate Narration", command=self.start_narration
+        )
+        self.generate_button.pack(anchor=tk.E, pady=5)
+
+        self.narration_progress_frame = ttk.Frame(narration_frame)
+        self.narration_status = ttk.Label(self.narration_progress_frame, text="")
+        self.narration_progress = ttk.Progressbar(
+            self.narration_progress_frame, mode='indeterminate'
+        )
+
+    def _drain_progress(self):
+        """Apply queued progress messages from the Tk thread"""
+        self.analysis_tracker.drain()
+        self.narration_tracker.drain()
+        self.root.after(100, self._drain_progress)
+
+    def select_video_file(self):
+        """Open file dialog for video selection"""
+        file_path = filedialog.askopenfilename(
+            title="Select Video File",
+            filetypes=[("Video files", "*.mp4 *.avi *.mov *.mkv"), ("All files", "*.*")]
+        )
+        if file_path:
+            self.video_path_var.set(file_path)
+            if not self.analysis_output_var.get():
+                self.analysis_output_var.set(str(Path(file_path).parent))
+
+    def select_json_file(self):
+        """Open file dialog for analysis file selection"""
+        file_path = filedialog.askopenfilename(
+            title="Select Analysis Results",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if file_path:
+            self.json_path_var.set(file_path)
+            if not self.narration_output_var.get():
+                self.narration_output_var.set(str(Path(file_path).parent))
 
     def select_output_directory(self, mode):
         """Open directory dialog for output selection"""
@@ -28,26 +188,26 @@
         if not self.video_path_var.get():
             messagebox.showerror("Error", "Please select a video file")
             return
-            
+
         if not self.analysis_template_var.get():
             messagebox.showerror("Error", "Please select a template")
             return
-            
+
         if not self.analysis_output_var.get():
             messagebox.showerror("Error", "Please select an output directory")
             return
-            
+
         template = self.template_manager.get_template_by_name(
             self.analysis_template_var.get()
         )
-        
+
         self.analyze_button.config(state='disabled')
         self.show_progress(
             self.analysis_progress,
             self.analysis_status,
             self.analysis_progress_frame
         )
-        
+
         # Start analysis in separate thread
         thread = threading.Thread(
             target=self.run_analysis,
@@ -63,22 +223,17 @@
     def run_analysis(self, video_path, template, output_dir):
         """Run video analysis in separate thread"""
         try:
-            progress_tracker = ProgressTracker(
-                self.analysis_progress,
-                self.analysis_status
-            )
-            
             with VideoAnalyzer(
                 video_path,
                 template,
                 self.client,
-                progress_tracker,
+                self.analysis_tracker,
                 output_dir
             ) as analyzer:
                 result_path = analyzer.analyze_video()
-            
+
             self.root.after(0, self.analysis_complete, result_path)
-            
+
         except Exception as e:
             self.root.after(0, self.show_error, str(e))
 
@@ -87,26 +242,26 @@
         if not self.json_path_var.get():
             messagebox.showerror("Error", "Please select an analysis file")
             return
-            
+
         if not self.narration_template_var.get():
             messagebox.showerror("Error", "Please select a template")
             return
-            
+
         if not self.narration_output_var.get():
             messagebox.showerror("Error", "Please select an output directory")
             return
-            
+
         template = self.template_manager.get_template_by_name(
             self.narration_template_var.get()
         )
-        
+
         self.generate_button.config(state='disabled')
         self.show_progress(
             self.narration_progress,
             self.narration_status,
             self.narration_progress_frame
         )
-        
+
         # Start generation in separate thread
         thread = threading.Thread(
             target=self.run_narration,
@@ -122,22 +277,17 @@
     def run_narration(self, json_path, template, output_dir):
         """Run narration generation in separate thread"""
         try:
-            progress_tracker = ProgressTracker(
-                self.narration_progress,
-                self.narration_status
-            )
-            
             with NarrativeGenerator(
                 json_path,
                 template,
                 self.client,
-                progress_tracker,
+                self.narration_tracker,
                 output_dir
             ) as generator:
                 result_path = generator.generate_script()
-            
+
             self.root.after(0, self.narration_complete, result_path)
-            
+
         except Exception as e:
             self.root.after(0, self.show_error, str(e))
 
@@ -189,4 +339,4 @@
 
 if __name__ == "__main__":
     app = VideoNarratorApp()
-    app.run()
\ No newline at end of file
+    app.run()
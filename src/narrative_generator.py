@@ -1,26 +1,74 @@
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import random
+import re
 from pathlib import Path
 import time
-from .utils import TimeFormatter, FileHandler, ProgressTracker
+from openai import AsyncOpenAI, RateLimitError
+from .app_utils import TimeFormatter, FileHandler, ProgressTracker
+
+# Optional streaming parser; without it frames fall back to an
+# in-memory parse
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional fast JSON codec; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The eight transition phrases compile into one alternation at module
+# load, so scene detection makes a single C-level pass over each
+# narration instead of eight Python-level substring scans
+_TRANSITION_RE = re.compile('|'.join(
+    re.escape(term) for term in (
+        'moving to', 'entering', 'stepping into', 'next we have',
+        'moving into', 'heading to', 'walking into', 'now in'
+    )
+))
 
 class NarrativeGenerator:
-    def __init__(self, json_path, template, openai_client, progress_tracker=None):
+    def __init__(self, json_path, template, openai_client, progress_tracker=None, output_dir=None):
         """Initialize narrative generator with analysis results and template"""
         self.json_path = Path(json_path)
         self.template = template
         self.client = openai_client
+        self.async_client = AsyncOpenAI(api_key=openai_client.api_key)
         self.progress = progress_tracker
         
-        # Read analysis results
-        with open(json_path, 'r', encoding='utf-8') as f:
-            self.analysis_data = json.load(f)
+        # One system prompt string shared verbatim by every scene call
+        # and the polish call. OpenAI caches identical request prefixes
+        # automatically, so keeping the static instructions in a single
+        # unchanging block lets all N scene requests reuse the prefix
+        # instead of re-billing the template prompt each time
+        self._system_prompt = (
+            "You are narrating one continuous video, scene by scene. "
+            "Follow the style guide below for every scene.\n\n"
+            + template.narration_prompt
+        )
+        
+        # Read analysis results. With ijson only the header keys are
+        # parsed here; frames stream lazily during scene detection, so
+        # peak memory stays at one scene instead of the whole file
+        if ijson is not None:
+            self.analysis_data = self._load_header()
+        elif orjson is not None:
+            self.analysis_data = orjson.loads(self.json_path.read_bytes())
+        else:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                self.analysis_data = json.load(f)
             
         # Setup output directory
         self.base_name = self.analysis_data['video_name']
         self.output_dir = FileHandler.setup_output_directory(
             f"{self.base_name}_narration",
-            parent_dir=self.json_path.parent
+            parent_dir=output_dir or self.json_path.parent
         )
 
     def update_progress(self, message):
@@ -29,57 +77,105 @@ class NarrativeGenerator:
             self.progress.update(message)
         logging.info(message)
 
+    def _load_header(self):
+        """Parse just video_name and metadata from the analysis file"""
+        header = {'video_name': None, 'metadata': {}}
+        with open(self.json_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == 'video_name':
+                    header['video_name'] = value
+                elif prefix.startswith('metadata.'):
+                    header['metadata'][prefix.split('.', 1)[1]] = value
+                elif prefix == 'frames':
+                    # The analyzer writes header keys before frames, so
+                    # everything needed is in hand by this point
+                    break
+        return header
+
+    def _iter_frames(self):
+        """Yield analysis frames one at a time"""
+        if ijson is not None:
+            with open(self.json_path, 'rb') as f:
+                yield from ijson.items(f, 'frames.item')
+        else:
+            yield from self.analysis_data['frames']
+
     def identify_scene_changes(self):
-        """Group frames into coherent scenes"""
-        scenes = []
+        """Yield coherent scenes as their boundaries are found"""
+        if ijson is None:
+            # Frames are already in memory: record boundary indices in
+            # one scan, then carve scenes out as C-level list slices
+            # instead of growing a per-scene list frame by frame
+            frames = self.analysis_data['frames']
+            boundaries = [0]
+            for i, frame in enumerate(frames):
+                description = frame.get('narration_lower') or frame['narration'].lower()
+                if i > 0 and _TRANSITION_RE.search(description) is not None:
+                    boundaries.append(i)
+            boundaries.append(len(frames))
+            for start, end in zip(boundaries, boundaries[1:]):
+                if start < end:
+                    yield frames[start:end]
+            return
+        
         current_scene = []
         
-        for frame in self.analysis_data['frames']:
-            description = frame['narration'].lower()
+        for frame in self._iter_frames():
+            # Older analysis files predate the pre-lowered field
+            description = frame.get('narration_lower') or frame['narration'].lower()
             
             # Check for scene transition indicators
-            is_transition = any(term in description for term in [
-                'moving to', 'entering', 'stepping into', 'next we have',
-                'moving into', 'heading to', 'walking into', 'now in'
-            ])
+            is_transition = _TRANSITION_RE.search(description) is not None
             
             if is_transition and current_scene:
-                scenes.append(current_scene)
+                yield current_scene
                 current_scene = [frame]
             else:
                 current_scene.append(frame)
         
-        # Add final scene
+        # Final scene
         if current_scene:
-            scenes.append(current_scene)
-        
-        return scenes
+            yield current_scene
+
+    async def _create_with_backoff(self, **kwargs):
+        """Call the completions API, backing off on rate limits"""
+        for attempt in range(5):
+            try:
+                return await self.async_client.chat.completions.create(**kwargs)
+            except RateLimitError:
+                if attempt == 4:
+                    raise
+                delay = 2 ** attempt + random.random()
+                logging.warning(f"Rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
 
-    def create_scene_narrative(self, scene):
+    async def create_scene_narrative(self, scene, semaphore):
         """Generate narrative for a single scene"""
         try:
-            # Prepare scene context
-            scene_start = TimeFormatter.seconds_to_timestamp(scene[0]['timestamp'])
+            # Prepare scene context; older analysis files predate the
+            # stored timecode field
+            scene_start = (
+                scene[0].get('timecode')
+                or TimeFormatter.seconds_to_timestamp(scene[0]['timestamp'])
+            )
             descriptions = [
-                f"[{TimeFormatter.seconds_to_timestamp(frame['timestamp'])}] {frame['narration']}"
+                f"[{frame.get('timecode') or TimeFormatter.seconds_to_timestamp(frame['timestamp'])}] {frame['narration']}"
                 for frame in scene
             ]
             
             scene_context = "\n".join(descriptions)
             
             # Get narrative from GPT
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": self.template.narration_prompt},
-                    {"role": "user", "content": f"Create a flowing narrative for this scene starting at [{scene_start}]:\n\n{scene_context}"}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
-            # Add small delay to avoid rate limits
-            time.sleep(0.5)
+            async with semaphore:
+                response = await self._create_with_backoff(
+                    model="gpt-4-turbo-preview",
+                    messages=[
+                        {"role": "system", "content": self._system_prompt},
+                        {"role": "user", "content": f"Create a flowing narrative for this scene starting at [{scene_start}]:\n\n{scene_context}"}
+                    ],
+                    temperature=0.7,
+                    max_tokens=500
+                )
             
             return response.choices[0].message.content
             
@@ -87,36 +183,109 @@ class NarrativeGenerator:
             logging.error(f"Error generating scene narrative: {str(e)}")
             raise
 
-    def generate_complete_narrative(self):
-        """Generate complete narrative script"""
+    async def _polish_window(self, window, has_context, semaphore):
+        """Polish one window of scene narratives in a bounded call"""
+        if has_context:
+            user_content = (
+                "The first passage below is context from the previous "
+                "section; do not repeat it. Polish the remaining passages, "
+                "ensuring smooth transitions while maintaining "
+                "timestamps:\n\n" + "\n\n".join(window)
+            )
+        else:
+            user_content = (
+                "Polish this narrative, ensuring smooth transitions "
+                "while maintaining timestamps:\n\n" + "\n\n".join(window)
+            )
+        async with semaphore:
+            response = await self._create_with_backoff(
+                model="gpt-4-turbo-preview",
+                messages=[
+                    {"role": "system", "content": self._system_prompt},
+                    {"role": "user", "content": user_content}
+                ],
+                temperature=0.7,
+                # Budget what the window's own scenes were generated
+                # with (500 each, context passage excluded), so polish
+                # never has less room than the text it is polishing
+                max_tokens=500 * (len(window) - has_context)
+            )
+        if response.choices[0].finish_reason == 'length':
+            # A truncated section would be stitched into the script and
+            # cached across reruns; fail loudly instead
+            raise RuntimeError(
+                "Polish output hit the token limit; narrative section truncated"
+            )
+        return response.choices[0].message.content
+
+    def generate_complete_narrative(self, sink):
+        """Generate the narrative, feeding chunks of text to sink"""
+        asyncio.run(self._generate_complete_narrative_async(sink))
+
+    async def _generate_complete_narrative_async(self, sink):
+        """Generate all scene narratives concurrently, then polish.
+
+        Polished sections go straight to sink (and the cache file)
+        window by window, so the finished script never exists as one
+        Python string.
+        """
         try:
+            # Hash the template prompt plus every narration while scenes
+            # stream out of the parser; on a rerun over unchanged inputs
+            # the cached script comes back without a single API call
             self.update_progress("Identifying scene changes...")
-            scenes = self.identify_scene_changes()
-            
-            self.update_progress("Generating narrative...")
-            scene_narratives = []
+            hasher = hashlib.blake2b(self.template.narration_prompt.encode())
+            scenes = []
+            for scene in self.identify_scene_changes():
+                for frame in scene:
+                    hasher.update(frame['narration'].encode())
+                scenes.append(scene)
             
-            for i, scene in enumerate(scenes, 1):
-                self.update_progress(f"Processing scene {i} of {len(scenes)}")
-                narrative = self.create_scene_narrative(scene)
-                scene_narratives.append(narrative)
+            cache_dir = self.output_dir.parent / '.narration_cache'
+            cache_path = cache_dir / f"{hasher.hexdigest()}.txt"
+            if cache_path.exists():
+                self.update_progress("Using cached narrative...")
+                with open(cache_path, 'r', encoding='utf-8') as cached:
+                    for chunk in iter(lambda: cached.read(65536), ''):
+                        sink(chunk)
+                return
             
-            # Combine all narratives
-            full_narrative = "\n\n".join(scene_narratives)
+            # Fan the scenes out concurrently; the semaphore keeps at
+            # most eight requests in flight so a long video doesn't
+            # blow through the rate limit in one burst
+            self.update_progress(f"Generating narrative for {len(scenes)} scenes...")
+            semaphore = asyncio.Semaphore(8)
+            scene_narratives = await asyncio.gather(
+                *(self.create_scene_narrative(scene, semaphore) for scene in scenes)
+            )
             
-            # Final pass to ensure smooth transitions
+            # Polish in concurrent windows of scenes rather than one
+            # big serial call: the single call silently truncated long
+            # videos at its token limit, and its wall-clock time now
+            # divides across the windows. Each window after the first
+            # sees the previous window's last scene as context so the
+            # seams stay smooth
             self.update_progress("Polishing final narrative...")
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": self.template.narration_prompt},
-                    {"role": "user", "content": "Polish this narrative, ensuring smooth transitions while maintaining timestamps:\n\n" + full_narrative}
-                ],
-                temperature=0.7,
-                max_tokens=2000
+            window_size = 5
+            windows = [
+                scene_narratives[max(i - 1, 0):i + window_size]
+                for i in range(0, len(scene_narratives), window_size)
+            ]
+            polished = await asyncio.gather(
+                *(self._polish_window(window, i > 0, semaphore)
+                  for i, window in enumerate(windows))
             )
             
-            return response.choices[0].message.content
+            cache_dir.mkdir(exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                for i, section in enumerate(polished):
+                    if i > 0:
+                        sink('\n\n')
+                        cache_file.write('\n\n')
+                    sink(section)
+                    cache_file.write(section)
+            os.replace(tmp_path, cache_path)
             
         except Exception as e:
             logging.error(f"Error generating complete narrative: {str(e)}")
@@ -144,17 +313,13 @@ Style Notes:
     def generate_script(self):
         """Generate and save complete narration script"""
         try:
-            # Generate narrative
-            narrative = self.generate_complete_narrative()
-            
-            # Combine with header
-            script_content = self.create_script_header() + narrative
-            
-            # Save script
-            self.update_progress("Saving script...")
             output_path = self.output_dir / f"{self.base_name}_narration.txt"
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(script_content)
+                f.write(self.create_script_header())
+                # Narrative chunks stream straight into the open handle
+                # behind the header instead of being concatenated into
+                # one script-sized string first
+                self.generate_complete_narrative(f.write)
             
             return str(output_path)
             
@@ -4,11 +4,12 @@ import json
 from pathlib import Path
 
 class PromptEditorDialog:
-    def __init__(self, parent, template):
+    def __init__(self, parent, template, template_manager=None):
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(f"Edit Prompts - {template.name}")
         self.dialog.geometry("800x600")
         self.template = template
+        self.template_manager = template_manager
         self.result = None
         
         # Make dialog modal
@@ -90,6 +91,8 @@ class PromptEditorDialog:
 
         self.template.analysis_prompt = analysis_prompt
         self.template.narration_prompt = narration_prompt
+        if self.template_manager is not None:
+            self.template_manager.mark_dirty(self.template.id)
         self.result = True
         self.dialog.destroy()
 
@@ -1,6 +1,13 @@
 import json
+import os
 from pathlib import Path
 
+# Optional fast JSON codec; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class NarrationTemplate:
     def __init__(self, id, name, description, analysis_prompt, narration_prompt):
         self.id = id
@@ -65,12 +72,25 @@ class NarrationTemplate:
 class TemplateManager:
     def __init__(self):
         self.templates = {}
-        self._initialize_templates()
-        self.load_custom_prompts()
+        self._custom_data = {}
+        self._custom_loaded = False
+        self._prompts_mtime = None
+        self._prompts_snapshot = None
+        self._dirty = set()
+        self._template_factories = {
+            'room-tour': self._make_room_tour,
+            'outdoor-scene': self._make_outdoor_scene,
+            'event-coverage': self._make_event_coverage,
+            'product-showcase': self._make_product_showcase,
+        }
 
-    def _initialize_templates(self):
-        # Room Walk-through Template
-        self.templates['room-tour'] = NarrationTemplate(
+    # Default templates are built on first access rather than at
+    # construction, which runs at GUI startup; deferring them (and the
+    # custom-prompts JSON read) keeps template setup off the first paint
+
+    @staticmethod
+    def _make_room_tour():
+        return NarrationTemplate(
             id='room-tour',
             name='Room Walk-through',
             description='Perfect for real estate, hotel rooms, and interior tours',
@@ -85,36 +105,178 @@ class TemplateManager:
                 Focus on practical details and clear transitions between spaces."""
         )
 
-        # Add other default templates...
-        [Previous template definitions remain the same...]
+    @staticmethod
+    def _make_outdoor_scene():
+        return NarrationTemplate(
+            id='outdoor-scene',
+            name='Outdoor Scenes',
+            description='Ideal for nature, landscapes, and exterior property views',
+            analysis_prompt="""Observe this outdoor scene as an experienced guide would.
+                Note key features like:
+                - Landscape elements and views
+                - Natural features and terrain
+                - Notable landmarks or structures
+                - Weather and lighting conditions
+                Use clear, straightforward language.""",
+            narration_prompt="""Develop a natural narrative that guides viewers through these outdoor scenes.
+                Use direct, clear language that connects different views and locations.
+                Focus on notable features and maintain a steady, comfortable pace."""
+        )
+
+    @staticmethod
+    def _make_event_coverage():
+        return NarrationTemplate(
+            id='event-coverage',
+            name='Event Coverage',
+            description='Great for ceremonies, gatherings, and special occasions',
+            analysis_prompt="""Analyze this event scene focusing on:
+                - Key activities and moments
+                - People and interactions
+                - Setting and atmosphere
+                - Timeline of events
+                Describe it clearly and chronologically.""",
+            narration_prompt="""Create a chronological narrative of the event that flows naturally.
+                Focus on key moments and transitions.
+                Maintain clear timing references while keeping a conversational tone."""
+        )
+
+    @staticmethod
+    def _make_product_showcase():
+        return NarrationTemplate(
+            id='product-showcase',
+            name='Product Showcase',
+            description='Suited for product demonstrations and features',
+            analysis_prompt="""Examine this product scene focusing on:
+                - Key features and functions
+                - Design elements
+                - Practical benefits
+                - Quality and craftsmanship
+                Use clear, non-marketing language.""",
+            narration_prompt="""Develop a straightforward narrative about the product's features and benefits.
+                Avoid marketing jargon and focus on practical information.
+                Create natural transitions between different aspects of the product."""
+        )
+
+    def _ensure_custom_loaded(self):
+        """Read custom prompts on first template access"""
+        if not self._custom_loaded:
+            self._custom_loaded = True
+            self.load_custom_prompts()
+
+    def _materialize(self, template_id):
+        """Build (or return the already-built) template for an id"""
+        template = self.templates.get(template_id)
+        if template is None:
+            factory = self._template_factories.get(template_id)
+            if factory is None:
+                return None
+            self._ensure_custom_loaded()
+            template = factory()
+            custom = self._custom_data.get(template_id)
+            if custom:
+                template = NarrationTemplate.from_dict(custom, template)
+            self.templates[template_id] = template
+        return template
+
+    def mark_dirty(self, template_id):
+        """Record that a template's prompts changed since the last save"""
+        self._dirty.add(template_id)
 
     def save_custom_prompts(self):
         """Save custom prompts to file"""
-        custom_data = {
-            template_id: template.to_dict() 
-            for template_id, template in self.templates.items() 
-            if template.has_custom_prompts()
-        }
-        
-        if custom_data:
-            save_path = Path('custom_prompts.json')
-            with open(save_path, 'w') as f:
+        # Nothing was edited since the last save: skip serializing the
+        # whole template set just to find that out
+        if not self._dirty:
+            return
+
+        # Start from the raw loaded data so customizations on templates
+        # never materialized this session survive the save
+        custom_data = dict(self._custom_data)
+        for template_id, template in self.templates.items():
+            if template.has_custom_prompts():
+                custom_data[template_id] = template.to_dict()
+            else:
+                custom_data.pop(template_id, None)
+
+        if not custom_data:
+            return
+
+        # Skip the write entirely when nothing changed since last save/load
+        snapshot = json.dumps(custom_data, sort_keys=True)
+        if snapshot == self._prompts_snapshot:
+            return
+
+        # Write to a temp file and swap it in, so a crash mid-write can
+        # never leave a half-written file for the next load to choke on
+        save_path = Path('custom_prompts.json')
+        tmp_path = save_path.with_name(save_path.name + '.tmp')
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(custom_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f:
                 json.dump(custom_data, f, indent=2)
+        os.replace(tmp_path, save_path)
+
+        self._prompts_snapshot = snapshot
+        self._prompts_mtime = save_path.stat().st_mtime
+        self._dirty.clear()
 
     def load_custom_prompts(self):
         """Load custom prompts from file"""
         try:
             load_path = Path('custom_prompts.json')
-            if load_path.exists():
+            if not load_path.exists():
+                return
+
+            # Skip the re-read when the file hasn't changed on disk
+            mtime = load_path.stat().st_mtime
+            if mtime == self._prompts_mtime:
+                return
+
+            if orjson is not None:
+                custom_data = orjson.loads(load_path.read_bytes())
+            else:
                 with open(load_path, 'r') as f:
                     custom_data = json.load(f)
-                
-                for template_id, data in custom_data.items():
-                    if template_id in self.templates:
-                        self.templates[template_id] = NarrationTemplate.from_dict(
-                            data, self.templates[template_id]
-                        )
+
+            self._custom_data = {
+                template_id: data
+                for template_id, data in custom_data.items()
+                if template_id in self._template_factories
+            }
+
+            # Re-apply to anything already built this session
+            for template_id in list(self.templates):
+                del self.templates[template_id]
+                self._materialize(template_id)
+
+            self._prompts_mtime = mtime
+            self._prompts_snapshot = json.dumps(custom_data, sort_keys=True)
         except Exception as e:
             print(f"Error loading custom prompts: {e}")
 
-    [Previous methods remain the same...]
\ No newline at end of file
+    def get_template(self, template_id):
+        """Get template by ID"""
+        return self._materialize(template_id)
+
+    def get_template_by_name(self, name):
+        """Get template by name"""
+        for template_id in self._template_factories:
+            template = self._materialize(template_id)
+            if template.name == name:
+                return template
+        return None
+
+    def get_template_names(self):
+        """Get list of template names"""
+        return [
+            self._materialize(template_id).name
+            for template_id in self._template_factories
+        ]
+
+    def get_template_descriptions(self):
+        """Get dictionary of template names and descriptions"""
+        return {
+            template.name: template.description
+            for template in map(self._materialize, self._template_factories)
+        }
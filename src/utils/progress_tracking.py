@@ -4,6 +4,7 @@ Handles progress bars, status updates, and progress reporting.
 """
 
 import logging
+import time
 from tkinter import ttk
 
 class ProgressTracker:
@@ -20,6 +21,15 @@ class ProgressTracker:
         self.progress_bar = progress_bar
         self.status_label = status_label
         self._is_active = False
+        # The widget's type never changes, and configure() is a Tcl
+        # round-trip: remember both so the hot path only assigns value
+        self._is_ttk_bar = isinstance(progress_bar, ttk.Progressbar)
+        self._mode = None
+        self._max = None
+        # Redraws are coalesced to ~30 Hz; per-frame callers fire far
+        # faster than the screen repaints and each drain is a Tcl
+        # round-trip
+        self._last_ui = 0.0
 
     @property
     def is_active(self):
@@ -47,7 +57,13 @@ class ProgressTracker:
         """
         if self.status_label:
             self.status_label.config(text=message)
-            self.status_label.update()
+            now = time.monotonic()
+            if now - self._last_ui >= 0.033:
+                self._last_ui = now
+                # Drain only redraws; a full update() re-enters input
+                # event handling and can re-trigger button commands
+                # mid-operation
+                self.status_label.update_idletasks()
         logging.info(message)
 
     def update_progress(self, value, maximum=100):
@@ -58,15 +74,31 @@ class ProgressTracker:
             value (int): Current progress value
             maximum (int, optional): Maximum progress value. Defaults to 100.
         """
-        if self.progress_bar and isinstance(self.progress_bar, ttk.Progressbar):
-            self.progress_bar.configure(mode='determinate', maximum=maximum)
+        if self._is_ttk_bar:
+            if self._mode != 'determinate' or self._max != maximum:
+                self.progress_bar.configure(mode='determinate', maximum=maximum)
+                self._mode = 'determinate'
+                self._max = maximum
             self.progress_bar['value'] = value
-            self.progress_bar.update()
+            now = time.monotonic()
+            # Completion always repaints so the bar never looks stuck
+            if value >= maximum or now - self._last_ui >= 0.033:
+                self._last_ui = now
+                self.progress_bar.update_idletasks()
+
+    def flush(self):
+        """Force an immediate redraw, e.g. at a milestone"""
+        self._last_ui = time.monotonic()
+        widget = self.progress_bar or self.status_label
+        if widget:
+            widget.update_idletasks()
 
     def set_indeterminate(self):
         """Set progress bar to indeterminate mode"""
         if self.progress_bar:
-            self.progress_bar.configure(mode='indeterminate')
+            if self._mode != 'indeterminate':
+                self.progress_bar.configure(mode='indeterminate')
+                self._mode = 'indeterminate'
             self.progress_bar.start()
 
     def hide(self):
@@ -1,27 +1,89 @@
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
+
+# Optional fast JSON codec; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import logging
-from moviepy.editor import VideoFileClip
-from PIL import Image
+import random
+import subprocess
+from imageio_ffmpeg import get_ffmpeg_exe
 import time
-from .utils import TimeFormatter, FileHandler, ImageHandler, ProgressTracker
+from openai import AsyncOpenAI, RateLimitError
+from .app_utils import TimeFormatter, FileHandler, ImageHandler, ProgressTracker
+
+class _RequestPacer:
+    """Paces API calls from the server's rate-limit headers.
+
+    Starts at full speed and only slows down when the remaining-request
+    budget reported by the last response is nearly exhausted, instead of
+    a fixed nap after every call regardless of the account's quota. The
+    gate serializes departure times across concurrent tasks so the
+    interval applies to the whole fan-out, not per task.
+    """
+
+    def __init__(self):
+        self._min_interval = 0.0
+        self._last_call = 0.0
+        self._gate = None
+
+    async def wait(self):
+        """Pause until the next request is allowed to go out"""
+        if self._gate is None:
+            self._gate = asyncio.Lock()
+        async with self._gate:
+            delay = self._min_interval - (time.monotonic() - self._last_call)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_call = time.monotonic()
+
+    def observe(self, headers):
+        """Adjust pacing from a response's rate-limit headers"""
+        try:
+            remaining = int(headers.get('x-ratelimit-remaining-requests'))
+            limit = int(headers.get('x-ratelimit-limit-requests'))
+        except (TypeError, ValueError):
+            return
+        if limit <= 0:
+            return
+        if remaining <= max(1, limit // 20):
+            # Under ~5% of the budget left: spread what remains over
+            # the rest of the minute
+            self._min_interval = 60.0 / max(remaining, 1)
+        else:
+            self._min_interval = 60.0 / limit
 
 class VideoAnalyzer:
-    def __init__(self, video_path, template, openai_client, progress_tracker=None):
+    def __init__(self, video_path, template, openai_client, progress_tracker=None, output_dir=None):
         """Initialize video analyzer with specified template and OpenAI client"""
         self.video_path = Path(video_path)
         self.template = template
         self.client = openai_client
+        self.async_client = AsyncOpenAI(api_key=openai_client.api_key)
         self.progress = progress_tracker
+        self._pacer = _RequestPacer()
+        self._encode_pool = None
         
         # Setup output directory and logging
         self.base_name = FileHandler.get_base_name(video_path)
-        self.output_dir = FileHandler.setup_output_directory(self.base_name)
+        self.output_dir = FileHandler.setup_output_directory(
+            self.base_name, parent_dir=output_dir
+        )
         self.frames_dir = self.output_dir / "frames"
         self.frames_dir.mkdir(exist_ok=True)
         
-        # Analysis results
-        self.frame_data = []
+        # Analysis results, kept as parallel arrays rather than a list
+        # of per-frame dicts: one list index replaces a dict allocation
+        # plus four key lookups for every frame touched in the hot loop
+        self.timestamps = []
+        self.frame_paths = []
+        self._b64_futures = []
 
     def update_progress(self, message):
         """Update progress in GUI if tracker exists"""
@@ -29,51 +91,161 @@ class VideoAnalyzer:
             self.progress.update(message)
         logging.info(message)
 
+    def _start_encoding(self):
+        """Queue base64 encoding for every extracted frame.
+
+        Kicked off as soon as the paths are known, so encoding overlaps
+        the first network round-trips instead of running serially in
+        front of each request. The JPEGs were written moments ago, so
+        these reads come from the page cache; each frame is decoded and
+        encoded exactly once between extraction and the API request.
+        """
+        self._encode_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._b64_futures = [
+            self._encode_pool.submit(ImageHandler.image_to_base64, path)
+            for path in self.frame_paths
+        ]
+
+    def _manifest_path(self, interval):
+        """Stable manifest location keyed on the video, not the run.
+
+        Output directories embed a per-session timestamp, so anything
+        stored inside them is invisible to later runs; the manifest
+        instead lives beside them keyed by video path, mtime, and
+        interval, the same way the narration cache is laid out.
+        """
+        key = hashlib.blake2b(
+            f"{self.video_path.resolve()}:{os.path.getmtime(self.video_path)}:{interval}".encode()
+        ).hexdigest()
+        return self.output_dir.parent / '.frames_cache' / f"{key}.json"
+
+    def _load_manifest(self, manifest_path):
+        """Reuse a previous extraction if its manifest still checks out"""
+        if orjson is not None:
+            manifest = orjson.loads(manifest_path.read_bytes())
+        else:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        
+        # The frames may live in an earlier run's directory; one
+        # directory snapshot validates every file instead of an
+        # exists() stat per frame
+        frames_dir = manifest.get('frames_dir')
+        if not frames_dir or not os.path.isdir(frames_dir):
+            return False
+        with os.scandir(frames_dir) as entries:
+            present = {entry.name for entry in entries}
+        if not all(os.path.basename(path) in present for path in manifest['frame_paths']):
+            return False
+        
+        self.timestamps = manifest['timestamps']
+        self.frame_paths = manifest['frame_paths']
+        return True
+
     def extract_frames(self, interval=1.0):
         """Extract frames from video at specified interval"""
         try:
-            self.update_progress("Loading video...")
-            with VideoFileClip(str(self.video_path)) as video:
-                duration = video.duration
-                frame_times = range(0, int(duration), int(interval))
-                total_frames = len(frame_times)
-
-                self.update_progress(f"Extracting {total_frames} frames...")
-                for i, t in enumerate(frame_times, 1):
-                    # Get and save frame
-                    frame = video.get_frame(t)
-                    frame_path = self.frames_dir / f"frame_{t:04d}.jpg"
-                    Image.fromarray(frame).save(frame_path)
-                    
-                    # Store frame information
-                    self.frame_data.append({
-                        'timestamp': t,
-                        'frame_path': str(frame_path),
-                        'index': i,
-                        'total_frames': total_frames
-                    })
-                    
-                    self.update_progress(f"Extracted frame {i} of {total_frames}")
+            # A surviving manifest from an earlier run (e.g. one that
+            # died mid-analysis) lets a retry skip the whole video
+            # decode
+            manifest_path = self._manifest_path(interval)
+            if manifest_path.exists() and self._load_manifest(manifest_path):
+                self.update_progress(
+                    f"Reusing {len(self.frame_paths)} previously extracted frames"
+                )
+                self._start_encoding()
+                return True
 
+            # One streaming ffmpeg decode writes every JPEG directly,
+            # replacing the per-timestamp get_frame() calls that each
+            # re-seek and re-decode the compressed stream, plus the
+            # numpy-array-to-PIL re-encode per frame. Frames are capped
+            # at 768px on the long side (never upscaled): GPT-4V gains
+            # nothing beyond that, and smaller JPEGs mean faster base64
+            # encoding and smaller request bodies for every frame
+            self.update_progress("Extracting frames...")
+            scale = "scale='min(768,iw)':'min(768,ih)':force_original_aspect_ratio=decrease"
+            subprocess.run(
+                [
+                    get_ffmpeg_exe(), '-hide_banner', '-loglevel', 'error',
+                    '-i', str(self.video_path),
+                    '-vf', f'fps=1/{interval},{scale}',
+                    '-q:v', '3',
+                    str(self.frames_dir / 'frame_%04d.jpg')
+                ],
+                check=True
+            )
+
+            # ffmpeg's %04d widens past four digits, so lexicographic
+            # order breaks after frame_9999; sort on the frame number
+            frame_files = sorted(
+                self.frames_dir.glob('frame_*.jpg'),
+                key=lambda p: int(p.stem.split('_')[1])
+            )
+            for i, frame_path in enumerate(frame_files):
+                self.timestamps.append(int(i * interval))
+                self.frame_paths.append(str(frame_path))
+
+            # Persist what was extracted so a retry after a mid-analysis
+            # failure costs a manifest read instead of a full re-decode
+            manifest = {
+                'frames_dir': str(self.frames_dir),
+                'timestamps': self.timestamps,
+                'frame_paths': self.frame_paths
+            }
+            manifest_path.parent.mkdir(exist_ok=True)
+            if orjson is not None:
+                manifest_path.write_bytes(orjson.dumps(manifest))
+            else:
+                with open(manifest_path, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f)
+
+            self._start_encoding()
+            self.update_progress(f"Extracted {len(self.frame_paths)} frames")
             return True
 
         except Exception as e:
             logging.error(f"Error extracting frames: {str(e)}")
             raise
 
-    def analyze_frame(self, frame_info):
-        """Analyze a single frame using GPT-4 Vision"""
+    async def _vision_request(self, **kwargs):
+        """Issue a vision request, backing off as the server directs"""
+        for attempt in range(5):
+            await self._pacer.wait()
+            try:
+                return await self.async_client.chat.completions.with_raw_response.create(**kwargs)
+            except RateLimitError as e:
+                if attempt == 4:
+                    raise
+                # Sleep exactly as long as the server asks via
+                # Retry-After when it says, exponential jitter when it
+                # does not
+                delay = 2 ** attempt + random.random()
+                response = getattr(e, 'response', None)
+                retry_after = response.headers.get('retry-after') if response is not None else None
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                logging.warning(f"Rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def analyze_frame(self, i):
+        """Analyze the i-th frame using GPT-4 Vision"""
         try:
-            # Convert image to base64
-            base64_image = ImageHandler.image_to_base64(frame_info['frame_path'])
+            # The pool started encoding at extraction time; by the time
+            # a frame's turn comes this is usually already resolved
+            base64_image = self._b64_futures[i].result()
             
             # Update progress
             self.update_progress(
-                f"Analyzing frame {frame_info['index']} of {frame_info['total_frames']}"
+                f"Analyzing frame {i + 1} of {len(self.frame_paths)}"
             )
             
-            # Create GPT-4 Vision request
-            response = self.client.chat.completions.create(
+            # Create GPT-4 Vision request; raw_response exposes the
+            # rate-limit headers that drive the pacer
+            raw = await self._vision_request(
                 model="gpt-4-vision-preview",
                 messages=[
                     {"role": "system", "content": self.template.analysis_prompt},
@@ -91,9 +263,8 @@ class VideoAnalyzer:
                 ],
                 max_tokens=300
             )
-            
-            # Add small delay to avoid rate limits
-            time.sleep(0.5)
+            self._pacer.observe(raw.headers)
+            response = raw.parse()
             
             return response.choices[0].message.content
 
@@ -101,6 +272,19 @@ class VideoAnalyzer:
             logging.error(f"Error analyzing frame: {str(e)}")
             raise
 
+    async def _analyze_all(self):
+        """Fan frame analysis out with bounded concurrency"""
+        # Each request spends seconds waiting on the API, so keeping a
+        # dozen in flight shrinks wall-clock roughly by that factor;
+        # the pacer still meters departures against the account quota
+        semaphore = asyncio.Semaphore(12)
+
+        async def run(i):
+            async with semaphore:
+                return await self.analyze_frame(i)
+
+        return await asyncio.gather(*(run(i) for i in range(len(self.frame_paths))))
+
     def analyze_video(self):
         """Process and analyze the entire video"""
         try:
@@ -108,37 +292,47 @@ class VideoAnalyzer:
             if not self.extract_frames():
                 raise Exception("Frame extraction failed")
 
-            # Analyze each frame
+            # Analyze frames concurrently
             self.update_progress("Starting frame analysis...")
-            analysis_results = []
-            
-            for frame in self.frame_data:
-                # Analyze frame
-                description = self.analyze_frame(frame)
-                
-                # Store results
-                analysis_results.append({
-                    'timestamp': frame['timestamp'],
-                    'frame_path': frame['frame_path'],
-                    'narration': description
-                })
-
-            # Save analysis results
+            descriptions = asyncio.run(self._analyze_all())
+
+            # Stream the results file one frame record at a time: the
+            # header keys go first (the narrator's streaming loader
+            # depends on seeing them before frames) and each record is
+            # serialized and written on its own, so the full results
+            # tree never exists as one in-memory object
             self.update_progress("Saving analysis results...")
-            results = {
-                'video_name': self.base_name,
-                'template_used': self.template.id,
-                'metadata': {
-                    'duration': self.frame_data[-1]['timestamp'] + 1,
-                    'frame_count': len(self.frame_data)
-                },
-                'frames': analysis_results
-            }
+            if orjson is not None:
+                dumps = lambda obj: orjson.dumps(obj).decode()
+            else:
+                dumps = json.dumps
 
-            # Save to JSON file
             output_path = self.output_dir / f"{self.base_name}_analysis.json"
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2)
+                f.write('{')
+                f.write(f'"video_name": {dumps(self.base_name)}, ')
+                f.write(f'"template_used": {dumps(self.template.id)}, ')
+                f.write('"metadata": ' + dumps({
+                    'duration': self.timestamps[-1] + 1,
+                    'frame_count': len(self.timestamps)
+                }) + ', ')
+                f.write('"frames": [')
+                for i, (timestamp, frame_path, description) in enumerate(zip(
+                    self.timestamps, self.frame_paths, descriptions
+                )):
+                    if i:
+                        f.write(', ')
+                    # The lowercased copy and timecode are written once
+                    # here so scene detection and narration never
+                    # re-derive them per run
+                    f.write(dumps({
+                        'timestamp': timestamp,
+                        'timecode': TimeFormatter.seconds_to_timestamp(timestamp),
+                        'frame_path': frame_path,
+                        'narration': description,
+                        'narration_lower': description.lower()
+                    }))
+                f.write(']}')
 
             return str(output_path)
 
@@ -150,6 +344,8 @@ class VideoAnalyzer:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._encode_pool is not None:
+            self._encode_pool.shutdown(wait=False)
         if exc_type is not None:
             logging.error(f"Error during video analysis: {str(exc_val)}")
         return False
\ No newline at end of file